@@ -1,3 +1,9 @@
 from .cmaps import Cmaps
 import sys
-sys.modules[__name__] = Cmaps()
+_cmaps = Cmaps()
+# keep cmaps importable as a package, e.g. for the lazily imported cmaps.colormap
+_cmaps.__path__ = __path__
+_cmaps.__spec__ = __spec__
+_cmaps.__file__ = __file__
+_cmaps.__name__ = __name__
+sys.modules[__name__] = _cmaps
@@ -1,50 +1,272 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import hashlib
+import json
 import os
-import re
 from glob import glob
-from packaging import version
 
-import matplotlib
-import matplotlib.cm
 import numpy as np
 
 from ._version import __version__
-from .colormap import Colormap
 
 CMAPSFILE_DIR = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), 'colormaps')
 USER_CMAPFILE_DIR = os.environ.get('CMAP_DIR')
-
-if version.parse(matplotlib.__version__) < version.parse('3.2.0'):
-    raise Exception('cmaps of version {} only supports matplotlib greater than 3.2'.format(__version__))
-
-if version.parse(matplotlib.__version__) >= version.parse('3.7'):
-    get_cmap = matplotlib.colormaps.get_cmap
-    register_cmap = matplotlib.colormaps.register
-else:
-    get_cmap = matplotlib.cm.get_cmap
-    register_cmap = matplotlib.cm.register_cmap
+# parsed CMAP_DIR tables are cached here, an empty CMAP_CACHE_DIR disables the cache
+USER_CMAPCACHE_DIR = os.environ.get('CMAP_CACHE_DIR', os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'cmaps'))
+# part of the cache key, bump it whenever what Cmaps._coltbl returns changes
+CACHE_FORMAT = 2
+# packed tables of the bundled colormaps written by setup.py
+BUNDLE_FILE = os.path.join(CMAPSFILE_DIR, 'colormaps.bin')
+BUNDLE_MANIFEST = os.path.join(CMAPSFILE_DIR, 'colormaps.json')
+
+# source of the bundled colormaps by their folder, CMAP_DIR colormaps are 'user'
+SOURCES = {'ncar_ncl': 'ncl', 'self_defined': 'self_defined'}
+
+# bound by _import_matplotlib() when the first colormap object is built
+register_cmap = cmap_registry = Colormap = None
+
+
+def _import_matplotlib():
+    '''
+    matplotlib (and the version gating) is only imported once a colormap object
+    is needed, so importing cmaps and reading raw tables stays cheap
+    '''
+    global register_cmap, cmap_registry, Colormap
+    if Colormap is not None:
+        return
+    from packaging import version
+    import matplotlib
+    import matplotlib.cm
+
+    if version.parse(matplotlib.__version__) < version.parse('3.2.0'):
+        raise Exception('cmaps of version {} only supports matplotlib greater than 3.2'.format(__version__))
+
+    if version.parse(matplotlib.__version__) >= version.parse('3.7'):
+        register_cmap = matplotlib.colormaps.register
+        cmap_registry = matplotlib.colormaps
+    else:
+        register_cmap = matplotlib.cm.register_cmap
+        cmap_registry = getattr(matplotlib.cm, '_cmap_registry', None) or matplotlib.cm.cmap_d
+
+    from .colormap import Colormap as _Colormap
+    Colormap = _Colormap
+
+
+def _starts_with_number(row):
+    try:
+        float(row.split(None, 1)[0])
+    except (IndexError, ValueError):
+        return False
+    return True
 
 
 class Cmaps(object):
     """colormaps"""
 
     def __init__(self, ):
-        self._parse_cmaps()
+        self._bundle = None
+        self._tables = {}
+        self._coltbls = {}
+        self._colormaps = {}
+        self._user_cmaps = {}
+        self._index_user_cmaps()
         self.__version__ = __version__
 
     def _coltbl(self, cmap_file):
-        pattern = re.compile(r'(\d\.?\d*)\s+(\d\.?\d*)\s+(\d\.?\d*).*')
+        '''
+        parse a .rgb file in a single pass: ncolors headers, comments (#, ;, /*) and
+        lines not starting with a number (e.g. an 'r g b' header) are dropped and the
+        first three columns are read, with the fourth as alpha
+        if every row has a numeric one (color names are ignored), integer tables
+        are scaled to [0, 1]. NCL uses -1 as a placeholder, which is read as 1
+        '''
         with open(cmap_file) as cmap:
-            cmap_buff = cmap.read()
-        cmap_buff = re.compile('ncolors.*\n').sub('', cmap_buff)
-        if re.search(r'\s*\d\.\d*', cmap_buff):
-            return np.asarray(pattern.findall(cmap_buff), 'f4')
+            rows = [line.partition('#')[0].partition(';')[0].partition('/*')[0]
+                    for line in cmap if not line.lstrip().startswith('ncolor')]
+        rows = [row for row in rows if _starts_with_number(row)]
+        try:
+            coltbl = np.loadtxt(rows, usecols=(0, 1, 2, 3), ndmin=2)
+        except (ValueError, IndexError):
+            coltbl = np.loadtxt(rows, usecols=(0, 1, 2), ndmin=2)
+        coltbl = np.abs(coltbl)
+        if any('.' in row for row in rows):
+            return coltbl.astype('f4')
         else:
-            return np.asarray(pattern.findall(cmap_buff), 'u1') / 255.
-
-    def _parse_cmaps(self):
+            return coltbl.astype('u1') / 255.
+
+    def _cached_coltbl(self, cmap_file):
+        '''
+        _coltbl backed by an on-disk cache in USER_CMAPCACHE_DIR, one .npz per file
+        (named after its path) holding the table and the CACHE_FORMAT, mtime and
+        size it was parsed at, so an unchanged file costs a stat instead of a
+        parse. An edited file is parsed again and its entry replaced, the cache
+        does not grow
+        '''
+        if not USER_CMAPCACHE_DIR:
+            return self._coltbl(cmap_file)
+        path = os.path.abspath(cmap_file)
+        st = os.stat(cmap_file)
+        key = '{}:{}:{}:{}'.format(CACHE_FORMAT, path, st.st_mtime_ns, st.st_size)
+        cache_file = os.path.join(USER_CMAPCACHE_DIR, hashlib.sha1(path.encode()).hexdigest() + '.npz')
+        try:
+            with np.load(cache_file) as cached:
+                if cached['key'] == key:
+                    return cached['table']
+        except (OSError, ValueError, EOFError, KeyError):
+            pass
+
+        coltbl = self._coltbl(cmap_file)
+        # write to a private file first, concurrent processes may fill the same entry
+        tmp_file = '{}.{}.tmp'.format(cache_file, os.getpid())
+        try:
+            os.makedirs(USER_CMAPCACHE_DIR, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                np.savez(f, key=key, table=coltbl)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+        return coltbl
+
+    def _load_bundle(self):
+        '''
+        map the bundle read-only, every table is a view into the same pages,
+        so processes using the same install share one copy of the data
+        '''
+        try:
+            with open(BUNDLE_MANIFEST) as f:
+                manifest = json.load(f)
+            table = np.asarray(np.memmap(BUNDLE_FILE, '<f4', mode='r'))
+        except (OSError, ValueError):
+            return {}
+        # validated by setup.py, so the manifest is trusted as is
+        return {k: table[m['offset']:m['offset'] + m['N'] * m['channels']].reshape(m['N'], m['channels'])
+                for k, m in manifest['colormaps'].items()}
+
+    def _bundled(self, cmap_file):
+        '''
+        table of a colormap file, a read-only view into the bundle if it is packed
+        there (bundled colormaps once setup.py built it), parsed from the file otherwise
+        '''
+        # CMAP_DIR files are never bundled (and may be on another drive than the install)
+        if cmap_file.startswith(CMAPSFILE_DIR + os.sep):
+            if self._bundle is None:
+                self._bundle = self._load_bundle()
+            key = cmap_file[len(CMAPSFILE_DIR) + 1:].replace(os.sep, '/')
+            if key in self._bundle:
+                return self._bundle[key]
+        # parsed once per file, a colormap and its _r are views of the same table
+        if cmap_file not in self._coltbls:
+            coltbl = self._cached_coltbl(cmap_file)
+            coltbl.flags.writeable = False
+            self._coltbls[cmap_file] = coltbl
+        return self._coltbls[cmap_file]
+
+    def table(self, cname, dtype='float32', reverse=False):
+        '''
+        raw Nx3 (Nx4 if its file gives alpha) table of a colormap, float in [0, 1]
+        or uint8 in [0, 255]
+
+        the array is cached and read-only, and no matplotlib object is built or
+        registered for it, so matplotlib is not even imported
+        '''
+        dtype = np.dtype(dtype)
+        if not (dtype.kind == 'f' or dtype == np.uint8):
+            raise ValueError('dtype must be a float type or uint8, not {}'.format(dtype))
+        try:
+            cmap_file, reversed_ = self._locate(cname)
+        except KeyError:
+            raise ValueError("'{}' is not a known colormap".format(cname)) from None
+        # cached in file order, the reversed table is a view of the same array
+        key = (cmap_file, dtype)
+        if key not in self._tables:
+            coltbl = self._bundled(cmap_file)
+            if dtype == np.uint8:
+                coltbl = np.rint(coltbl * 255).astype(dtype)
+            else:
+                coltbl = coltbl.astype(dtype, copy=False)
+            coltbl.flags.writeable = False
+            self._tables[key] = coltbl
+        coltbl = self._tables[key]
+        return coltbl[::-1] if reversed_ != bool(reverse) else coltbl
+
+    def batch_interp(self, names, lutsize=256, space='srgb'):
+        '''
+        the colormaps names interpolated to lutsize colors each, like Colormap.interp
+        but as one (len(names), lutsize, 4) float RGBA array and without building any
+        colormap: tables of the same length are stacked and interpolated in one pass
+        '''
+        from .colormap import _from_space, _resample, _to_space
+        tables = [self.table(name) for name in names]
+        groups = {}
+        for i, coltbl in enumerate(tables):
+            groups.setdefault(coltbl.shape, []).append(i)
+        lut = np.ones((len(names), lutsize, 4))
+        for (n, channels), index in groups.items():
+            stacked = np.stack([tables[i] for i in index]).astype(float)
+            converted = _to_space(stacked[..., :3].reshape(-1, 3), space).reshape(len(index), n, 3)
+            values = _resample(np.concatenate([converted, stacked[..., 3:]], axis=-1), lutsize)
+            lut[index, :, :3] = _from_space(values[..., :3].reshape(-1, 3), space).reshape(len(index), lutsize, 3)
+            lut[index, :, 3:channels] = values[..., 3:]
+        return lut
+
+    def _locate(self, cname):
+        '''(cmap_file, reversed) of a colormap name, CMAP_DIR colormaps take precedence'''
+        if cname in self._user_cmaps:
+            return self._user_cmaps[cname]
+        cmap_file, reverse = self._cmaps[cname]
+        return os.path.join(CMAPSFILE_DIR, *cmap_file.split('/')), reverse
+
+    def __getattr__(self, cname):
+        # colormaps are built once, later accesses are a dict hit
+        cmap = self._colormaps.get(cname)
+        if cmap is not None:
+            return cmap
+        try:
+            cmap_file, reverse = self._locate(cname)
+        except KeyError:
+            raise AttributeError("module 'cmaps' has no attribute '{}'".format(cname)) from None
+        _import_matplotlib()
+        coltbl = self._bundled(cmap_file)
+        cmap = Colormap(coltbl[::-1] if reverse else coltbl, name=cname)
+        # names matplotlib already knows (e.g. viridis) keep their registered colormap
+        if cname not in cmap_registry:
+            register_cmap(name=cname, cmap=cmap)
+        # every cmaps.X is this one object, so its extremes can not be set in place
+        # (use cmaps.X.with_extremes(...) or cmaps.X.copy())
+        cmap._frozen = True
+        self._colormaps[cname] = cmap
+        return cmap
+
+    def list_cmaps(self, source=None, reverse=None):
+        '''
+        sorted names of the colormaps, read from the index without loading any table
+
+        source: 'ncl', 'self_defined' or 'user' (CMAP_DIR), or a list of them, all by default
+        reverse: True for the _r colormaps only, False for the others only, both by default
+        '''
+        if isinstance(source, str):
+            source = [source]
+        names = []
+        for cname in set(self._cmaps) | set(self._user_cmaps):
+            if cname in self._user_cmaps:
+                cmap_source, reversed_ = 'user', self._user_cmaps[cname][1]
+            else:
+                cmap_file, reversed_ = self._cmaps[cname]
+                cmap_source = SOURCES[cmap_file.split('/')[0]]
+            if (source is None or cmap_source in source) and (reverse is None or reversed_ == reverse):
+                names.append(cname)
+        return sorted(names)
+
+    def __dir__(self):
+        return sorted(set(super(Cmaps, self).__dir__()) | set(self._cmaps) | set(self._user_cmaps))
+
+    def _index_user_cmaps(self):
+        '''
+        index the colormaps in CMAP_DIR by name, they are only parsed and
+        registered when they are first used
+        '''
         if USER_CMAPFILE_DIR is not None:
             cmapsflist = sorted(glob(os.path.join(USER_CMAPFILE_DIR, '*.rgb')))
             for cmap_file in cmapsflist:
@@ -56,7873 +278,715 @@ class Cmaps(object):
                     cname = 'cmaps_' + cname.replace('-', '_')
                 if '+' in cname:
                     cname = 'cmaps_' + cname.replace('+', '_')
-
-                try:
-                    cmap = get_cmap(cname)
-                except:
-                    cmap = Colormap(self._coltbl(cmap_file), name=cname)
-                    register_cmap(name=cname, cmap=cmap)
-                setattr(self, cname, cmap)
-
-                cname = cname + '_r'
-                try:
-                    cmap = get_cmap(cname)
-                except:
-                    cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-                    register_cmap(name=cname, cmap=cmap)
-                setattr(self, cname, cmap)
-
-    @property
-    def N3gauss(self):
-        cname = "N3gauss"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "3gauss.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def N3gauss_r(self):
-        cname = "N3gauss_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "3gauss.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def N3saw(self):
-        cname = "N3saw"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "3saw.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def N3saw_r(self):
-        cname = "N3saw_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "3saw.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BkBlAqGrYeOrReViWh200(self):
-        cname = "BkBlAqGrYeOrReViWh200"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BkBlAqGrYeOrReViWh200.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BkBlAqGrYeOrReViWh200_r(self):
-        cname = "BkBlAqGrYeOrReViWh200_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BkBlAqGrYeOrReViWh200.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlAqGrWh2YeOrReVi22(self):
-        cname = "BlAqGrWh2YeOrReVi22"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlAqGrWh2YeOrReVi22.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlAqGrWh2YeOrReVi22_r(self):
-        cname = "BlAqGrWh2YeOrReVi22_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlAqGrWh2YeOrReVi22.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlAqGrYeOrRe(self):
-        cname = "BlAqGrYeOrRe"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlAqGrYeOrRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlAqGrYeOrRe_r(self):
-        cname = "BlAqGrYeOrRe_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlAqGrYeOrRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlAqGrYeOrReVi200(self):
-        cname = "BlAqGrYeOrReVi200"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlAqGrYeOrReVi200.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlAqGrYeOrReVi200_r(self):
-        cname = "BlAqGrYeOrReVi200_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlAqGrYeOrReVi200.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlGrYeOrReVi200(self):
-        cname = "BlGrYeOrReVi200"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlGrYeOrReVi200.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlGrYeOrReVi200_r(self):
-        cname = "BlGrYeOrReVi200_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlGrYeOrReVi200.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlRe(self):
-        cname = "BlRe"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlRe_r(self):
-        cname = "BlRe_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlWhRe(self):
-        cname = "BlWhRe"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlWhRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlWhRe_r(self):
-        cname = "BlWhRe_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlWhRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueDarkOrange18(self):
-        cname = "BlueDarkOrange18"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueDarkOrange18.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueDarkOrange18_r(self):
-        cname = "BlueDarkOrange18_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueDarkOrange18.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueDarkRed18(self):
-        cname = "BlueDarkRed18"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueDarkRed18.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueDarkRed18_r(self):
-        cname = "BlueDarkRed18_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueDarkRed18.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueGreen14(self):
-        cname = "BlueGreen14"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueGreen14.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueGreen14_r(self):
-        cname = "BlueGreen14_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueGreen14.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueRed(self):
-        cname = "BlueRed"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueRed_r(self):
-        cname = "BlueRed_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueRedGray(self):
-        cname = "BlueRedGray"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueRedGray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueRedGray_r(self):
-        cname = "BlueRedGray_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueRedGray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueWhiteOrangeRed(self):
-        cname = "BlueWhiteOrangeRed"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueWhiteOrangeRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueWhiteOrangeRed_r(self):
-        cname = "BlueWhiteOrangeRed_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueWhiteOrangeRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueYellowRed(self):
-        cname = "BlueYellowRed"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueYellowRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BlueYellowRed_r(self):
-        cname = "BlueYellowRed_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BlueYellowRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BrownBlue12(self):
-        cname = "BrownBlue12"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BrownBlue12.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def BrownBlue12_r(self):
-        cname = "BrownBlue12_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "BrownBlue12.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def CBR_coldhot(self):
-        cname = "CBR_coldhot"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "CBR_coldhot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def CBR_coldhot_r(self):
-        cname = "CBR_coldhot_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "CBR_coldhot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def CBR_drywet(self):
-        cname = "CBR_drywet"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "CBR_drywet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def CBR_drywet_r(self):
-        cname = "CBR_drywet_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "CBR_drywet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def CBR_set3(self):
-        cname = "CBR_set3"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "CBR_set3.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def CBR_set3_r(self):
-        cname = "CBR_set3_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "CBR_set3.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def CBR_wet(self):
-        cname = "CBR_wet"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "CBR_wet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def CBR_wet_r(self):
-        cname = "CBR_wet_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "CBR_wet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def Cat12(self):
-        cname = "Cat12"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "Cat12.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def Cat12_r(self):
-        cname = "Cat12_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "Cat12.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GHRSST_anomaly(self):
-        cname = "GHRSST_anomaly"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GHRSST_anomaly.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GHRSST_anomaly_r(self):
-        cname = "GHRSST_anomaly_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GHRSST_anomaly.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_cool(self):
-        cname = "GMT_cool"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_cool.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_cool_r(self):
-        cname = "GMT_cool_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_cool.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_copper(self):
-        cname = "GMT_copper"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_copper.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_copper_r(self):
-        cname = "GMT_copper_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_copper.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_drywet(self):
-        cname = "GMT_drywet"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_drywet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_drywet_r(self):
-        cname = "GMT_drywet_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_drywet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_gebco(self):
-        cname = "GMT_gebco"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_gebco.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_gebco_r(self):
-        cname = "GMT_gebco_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_gebco.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_globe(self):
-        cname = "GMT_globe"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_globe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_globe_r(self):
-        cname = "GMT_globe_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_globe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_gray(self):
-        cname = "GMT_gray"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_gray_r(self):
-        cname = "GMT_gray_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_haxby(self):
-        cname = "GMT_haxby"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_haxby.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_haxby_r(self):
-        cname = "GMT_haxby_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_haxby.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_hot(self):
-        cname = "GMT_hot"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_hot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_hot_r(self):
-        cname = "GMT_hot_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_hot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_jet(self):
-        cname = "GMT_jet"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_jet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_jet_r(self):
-        cname = "GMT_jet_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_jet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_nighttime(self):
-        cname = "GMT_nighttime"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_nighttime.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_nighttime_r(self):
-        cname = "GMT_nighttime_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_nighttime.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_no_green(self):
-        cname = "GMT_no_green"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_no_green.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_no_green_r(self):
-        cname = "GMT_no_green_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_no_green.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_ocean(self):
-        cname = "GMT_ocean"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_ocean.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_ocean_r(self):
-        cname = "GMT_ocean_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_ocean.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_paired(self):
-        cname = "GMT_paired"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_paired.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_paired_r(self):
-        cname = "GMT_paired_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_paired.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_panoply(self):
-        cname = "GMT_panoply"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_panoply.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_panoply_r(self):
-        cname = "GMT_panoply_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_panoply.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_polar(self):
-        cname = "GMT_polar"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_polar.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_polar_r(self):
-        cname = "GMT_polar_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_polar.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_red2green(self):
-        cname = "GMT_red2green"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_red2green.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_red2green_r(self):
-        cname = "GMT_red2green_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_red2green.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_relief(self):
-        cname = "GMT_relief"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_relief.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_relief_r(self):
-        cname = "GMT_relief_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_relief.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_relief_oceanonly(self):
-        cname = "GMT_relief_oceanonly"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_relief_oceanonly.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_relief_oceanonly_r(self):
-        cname = "GMT_relief_oceanonly_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_relief_oceanonly.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_seis(self):
-        cname = "GMT_seis"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_seis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_seis_r(self):
-        cname = "GMT_seis_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_seis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_split(self):
-        cname = "GMT_split"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_split.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_split_r(self):
-        cname = "GMT_split_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_split.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_topo(self):
-        cname = "GMT_topo"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_topo.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_topo_r(self):
-        cname = "GMT_topo_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_topo.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_wysiwyg(self):
-        cname = "GMT_wysiwyg"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_wysiwyg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_wysiwyg_r(self):
-        cname = "GMT_wysiwyg_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_wysiwyg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_wysiwygcont(self):
-        cname = "GMT_wysiwygcont"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_wysiwygcont.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_wysiwygcont_r(self):
-        cname = "GMT_wysiwygcont_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GMT_wysiwygcont.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GSFC_landsat_udf_density(self):
-        cname = "GSFC_landsat_udf_density"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GSFC_landsat_udf_density.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GSFC_landsat_udf_density_r(self):
-        cname = "GSFC_landsat_udf_density_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GSFC_landsat_udf_density.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GrayWhiteGray(self):
-        cname = "GrayWhiteGray"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GrayWhiteGray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GrayWhiteGray_r(self):
-        cname = "GrayWhiteGray_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GrayWhiteGray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GreenMagenta16(self):
-        cname = "GreenMagenta16"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GreenMagenta16.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GreenMagenta16_r(self):
-        cname = "GreenMagenta16_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GreenMagenta16.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GreenYellow(self):
-        cname = "GreenYellow"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GreenYellow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GreenYellow_r(self):
-        cname = "GreenYellow_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "GreenYellow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Accent(self):
-        cname = "MPL_Accent"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Accent.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Accent_r(self):
-        cname = "MPL_Accent_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Accent.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Blues(self):
-        cname = "MPL_Blues"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Blues.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Blues_r(self):
-        cname = "MPL_Blues_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Blues.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_BrBG(self):
-        cname = "MPL_BrBG"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_BrBG.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_BrBG_r(self):
-        cname = "MPL_BrBG_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_BrBG.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_BuGn(self):
-        cname = "MPL_BuGn"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_BuGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_BuGn_r(self):
-        cname = "MPL_BuGn_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_BuGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_BuPu(self):
-        cname = "MPL_BuPu"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_BuPu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_BuPu_r(self):
-        cname = "MPL_BuPu_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_BuPu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Dark2(self):
-        cname = "MPL_Dark2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Dark2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Dark2_r(self):
-        cname = "MPL_Dark2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Dark2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_GnBu(self):
-        cname = "MPL_GnBu"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_GnBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_GnBu_r(self):
-        cname = "MPL_GnBu_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_GnBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Greens(self):
-        cname = "MPL_Greens"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Greens.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Greens_r(self):
-        cname = "MPL_Greens_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Greens.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Greys(self):
-        cname = "MPL_Greys"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Greys.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Greys_r(self):
-        cname = "MPL_Greys_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Greys.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_OrRd(self):
-        cname = "MPL_OrRd"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_OrRd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_OrRd_r(self):
-        cname = "MPL_OrRd_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_OrRd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Oranges(self):
-        cname = "MPL_Oranges"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Oranges.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Oranges_r(self):
-        cname = "MPL_Oranges_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Oranges.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PRGn(self):
-        cname = "MPL_PRGn"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PRGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PRGn_r(self):
-        cname = "MPL_PRGn_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PRGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Paired(self):
-        cname = "MPL_Paired"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Paired.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Paired_r(self):
-        cname = "MPL_Paired_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Paired.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Pastel1(self):
-        cname = "MPL_Pastel1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Pastel1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Pastel1_r(self):
-        cname = "MPL_Pastel1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Pastel1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Pastel2(self):
-        cname = "MPL_Pastel2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Pastel2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Pastel2_r(self):
-        cname = "MPL_Pastel2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Pastel2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PiYG(self):
-        cname = "MPL_PiYG"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PiYG.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PiYG_r(self):
-        cname = "MPL_PiYG_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PiYG.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PuBu(self):
-        cname = "MPL_PuBu"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PuBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PuBu_r(self):
-        cname = "MPL_PuBu_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PuBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PuBuGn(self):
-        cname = "MPL_PuBuGn"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PuBuGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PuBuGn_r(self):
-        cname = "MPL_PuBuGn_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PuBuGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PuOr(self):
-        cname = "MPL_PuOr"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PuOr.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PuOr_r(self):
-        cname = "MPL_PuOr_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PuOr.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PuRd(self):
-        cname = "MPL_PuRd"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PuRd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_PuRd_r(self):
-        cname = "MPL_PuRd_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_PuRd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Purples(self):
-        cname = "MPL_Purples"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Purples.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Purples_r(self):
-        cname = "MPL_Purples_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Purples.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdBu(self):
-        cname = "MPL_RdBu"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdBu_r(self):
-        cname = "MPL_RdBu_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdGy(self):
-        cname = "MPL_RdGy"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdGy.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdGy_r(self):
-        cname = "MPL_RdGy_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdGy.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdPu(self):
-        cname = "MPL_RdPu"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdPu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdPu_r(self):
-        cname = "MPL_RdPu_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdPu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdYlBu(self):
-        cname = "MPL_RdYlBu"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdYlBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdYlBu_r(self):
-        cname = "MPL_RdYlBu_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdYlBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdYlGn(self):
-        cname = "MPL_RdYlGn"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdYlGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_RdYlGn_r(self):
-        cname = "MPL_RdYlGn_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_RdYlGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Reds(self):
-        cname = "MPL_Reds"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Reds.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Reds_r(self):
-        cname = "MPL_Reds_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Reds.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Set1(self):
-        cname = "MPL_Set1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Set1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Set1_r(self):
-        cname = "MPL_Set1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Set1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Set2(self):
-        cname = "MPL_Set2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Set2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Set2_r(self):
-        cname = "MPL_Set2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Set2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Set3(self):
-        cname = "MPL_Set3"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Set3.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Set3_r(self):
-        cname = "MPL_Set3_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Set3.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Spectral(self):
-        cname = "MPL_Spectral"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Spectral.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_Spectral_r(self):
-        cname = "MPL_Spectral_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_Spectral.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_StepSeq(self):
-        cname = "MPL_StepSeq"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_StepSeq.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_StepSeq_r(self):
-        cname = "MPL_StepSeq_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_StepSeq.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_YlGn(self):
-        cname = "MPL_YlGn"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_YlGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_YlGn_r(self):
-        cname = "MPL_YlGn_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_YlGn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_YlGnBu(self):
-        cname = "MPL_YlGnBu"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_YlGnBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_YlGnBu_r(self):
-        cname = "MPL_YlGnBu_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_YlGnBu.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_YlOrBr(self):
-        cname = "MPL_YlOrBr"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_YlOrBr.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_YlOrBr_r(self):
-        cname = "MPL_YlOrBr_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_YlOrBr.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_YlOrRd(self):
-        cname = "MPL_YlOrRd"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_YlOrRd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_YlOrRd_r(self):
-        cname = "MPL_YlOrRd_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_YlOrRd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_afmhot(self):
-        cname = "MPL_afmhot"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_afmhot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_afmhot_r(self):
-        cname = "MPL_afmhot_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_afmhot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_autumn(self):
-        cname = "MPL_autumn"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_autumn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_autumn_r(self):
-        cname = "MPL_autumn_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_autumn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_bone(self):
-        cname = "MPL_bone"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_bone.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_bone_r(self):
-        cname = "MPL_bone_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_bone.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_brg(self):
-        cname = "MPL_brg"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_brg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_brg_r(self):
-        cname = "MPL_brg_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_brg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_bwr(self):
-        cname = "MPL_bwr"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_bwr.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_bwr_r(self):
-        cname = "MPL_bwr_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_bwr.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_cool(self):
-        cname = "MPL_cool"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_cool.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_cool_r(self):
-        cname = "MPL_cool_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_cool.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_coolwarm(self):
-        cname = "MPL_coolwarm"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_coolwarm.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_coolwarm_r(self):
-        cname = "MPL_coolwarm_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_coolwarm.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_copper(self):
-        cname = "MPL_copper"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_copper.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_copper_r(self):
-        cname = "MPL_copper_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_copper.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_cubehelix(self):
-        cname = "MPL_cubehelix"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_cubehelix.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_cubehelix_r(self):
-        cname = "MPL_cubehelix_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_cubehelix.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_flag(self):
-        cname = "MPL_flag"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_flag.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_flag_r(self):
-        cname = "MPL_flag_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_flag.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_earth(self):
-        cname = "MPL_gist_earth"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_earth.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_earth_r(self):
-        cname = "MPL_gist_earth_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_earth.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_gray(self):
-        cname = "MPL_gist_gray"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_gray_r(self):
-        cname = "MPL_gist_gray_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_heat(self):
-        cname = "MPL_gist_heat"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_heat.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_heat_r(self):
-        cname = "MPL_gist_heat_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_heat.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_ncar(self):
-        cname = "MPL_gist_ncar"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_ncar.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_ncar_r(self):
-        cname = "MPL_gist_ncar_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_ncar.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_rainbow(self):
-        cname = "MPL_gist_rainbow"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_rainbow_r(self):
-        cname = "MPL_gist_rainbow_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_stern(self):
-        cname = "MPL_gist_stern"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_stern.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_stern_r(self):
-        cname = "MPL_gist_stern_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_stern.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_yarg(self):
-        cname = "MPL_gist_yarg"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_yarg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gist_yarg_r(self):
-        cname = "MPL_gist_yarg_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gist_yarg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gnuplot(self):
-        cname = "MPL_gnuplot"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gnuplot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gnuplot_r(self):
-        cname = "MPL_gnuplot_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gnuplot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gnuplot2(self):
-        cname = "MPL_gnuplot2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gnuplot2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_gnuplot2_r(self):
-        cname = "MPL_gnuplot2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_gnuplot2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_hot(self):
-        cname = "MPL_hot"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_hot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_hot_r(self):
-        cname = "MPL_hot_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_hot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_hsv(self):
-        cname = "MPL_hsv"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_hsv.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_hsv_r(self):
-        cname = "MPL_hsv_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_hsv.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_jet(self):
-        cname = "MPL_jet"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_jet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_jet_r(self):
-        cname = "MPL_jet_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_jet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_ocean(self):
-        cname = "MPL_ocean"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_ocean.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_ocean_r(self):
-        cname = "MPL_ocean_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_ocean.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_pink(self):
-        cname = "MPL_pink"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_pink.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_pink_r(self):
-        cname = "MPL_pink_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_pink.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_prism(self):
-        cname = "MPL_prism"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_prism.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_prism_r(self):
-        cname = "MPL_prism_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_prism.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_rainbow(self):
-        cname = "MPL_rainbow"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_rainbow_r(self):
-        cname = "MPL_rainbow_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_s3pcpn(self):
-        cname = "MPL_s3pcpn"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_s3pcpn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_s3pcpn_r(self):
-        cname = "MPL_s3pcpn_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_s3pcpn.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_s3pcpn_l(self):
-        cname = "MPL_s3pcpn_l"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_s3pcpn_l.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_s3pcpn_l_r(self):
-        cname = "MPL_s3pcpn_l_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_s3pcpn_l.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_seismic(self):
-        cname = "MPL_seismic"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_seismic.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_seismic_r(self):
-        cname = "MPL_seismic_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_seismic.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_spring(self):
-        cname = "MPL_spring"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_spring.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_spring_r(self):
-        cname = "MPL_spring_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_spring.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_sstanom(self):
-        cname = "MPL_sstanom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_sstanom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_sstanom_r(self):
-        cname = "MPL_sstanom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_sstanom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_summer(self):
-        cname = "MPL_summer"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_summer.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_summer_r(self):
-        cname = "MPL_summer_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_summer.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_terrain(self):
-        cname = "MPL_terrain"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_terrain.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_terrain_r(self):
-        cname = "MPL_terrain_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_terrain.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_viridis(self):
-        cname = "MPL_viridis"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_viridis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_viridis_r(self):
-        cname = "MPL_viridis_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_viridis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_winter(self):
-        cname = "MPL_winter"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_winter.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MPL_winter_r(self):
-        cname = "MPL_winter_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "MPL_winter.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_banded(self):
-        cname = "NCV_banded"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_banded.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_banded_r(self):
-        cname = "NCV_banded_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_banded.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_blu_red(self):
-        cname = "NCV_blu_red"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_blu_red.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_blu_red_r(self):
-        cname = "NCV_blu_red_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_blu_red.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_blue_red(self):
-        cname = "NCV_blue_red"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_blue_red.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_blue_red_r(self):
-        cname = "NCV_blue_red_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_blue_red.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_bright(self):
-        cname = "NCV_bright"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_bright.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_bright_r(self):
-        cname = "NCV_bright_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_bright.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_gebco(self):
-        cname = "NCV_gebco"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_gebco.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_gebco_r(self):
-        cname = "NCV_gebco_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_gebco.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_jaisnd(self):
-        cname = "NCV_jaisnd"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_jaisnd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_jaisnd_r(self):
-        cname = "NCV_jaisnd_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_jaisnd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_jet(self):
-        cname = "NCV_jet"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_jet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_jet_r(self):
-        cname = "NCV_jet_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_jet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_manga(self):
-        cname = "NCV_manga"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_manga.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_manga_r(self):
-        cname = "NCV_manga_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_manga.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_rainbow2(self):
-        cname = "NCV_rainbow2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_rainbow2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_rainbow2_r(self):
-        cname = "NCV_rainbow2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_rainbow2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_roullet(self):
-        cname = "NCV_roullet"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_roullet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCV_roullet_r(self):
-        cname = "NCV_roullet_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NCV_roullet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_div_vegetation_a(self):
-        cname = "NEO_div_vegetation_a"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NEO_div_vegetation_a.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_div_vegetation_a_r(self):
-        cname = "NEO_div_vegetation_a_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NEO_div_vegetation_a.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_div_vegetation_b(self):
-        cname = "NEO_div_vegetation_b"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NEO_div_vegetation_b.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_div_vegetation_b_r(self):
-        cname = "NEO_div_vegetation_b_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NEO_div_vegetation_b.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_div_vegetation_c(self):
-        cname = "NEO_div_vegetation_c"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NEO_div_vegetation_c.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_div_vegetation_c_r(self):
-        cname = "NEO_div_vegetation_c_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NEO_div_vegetation_c.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_ndvi(self):
-        cname = "NEO_modis_ndvi"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NEO_modis_ndvi.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_ndvi_r(self):
-        cname = "NEO_modis_ndvi_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NEO_modis_ndvi.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NMCRef(self):
-        cname = "NMCRef"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NMCRef.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NMCRef_r(self):
-        cname = "NMCRef_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NMCRef.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NMCVel(self):
-        cname = "NMCVel"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NMCVel.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NMCVel_r(self):
-        cname = "NMCVel_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NMCVel.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NOC_ndvi(self):
-        cname = "NOC_ndvi"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NOC_ndvi.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NOC_ndvi_r(self):
-        cname = "NOC_ndvi_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "NOC_ndvi.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def OceanLakeLandSnow(self):
-        cname = "OceanLakeLandSnow"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "OceanLakeLandSnow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def OceanLakeLandSnow_r(self):
-        cname = "OceanLakeLandSnow_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "OceanLakeLandSnow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_Gallet13(self):
-        cname = "SVG_Gallet13"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_Gallet13.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_Gallet13_r(self):
-        cname = "SVG_Gallet13_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_Gallet13.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_Lindaa06(self):
-        cname = "SVG_Lindaa06"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_Lindaa06.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_Lindaa06_r(self):
-        cname = "SVG_Lindaa06_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_Lindaa06.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_Lindaa07(self):
-        cname = "SVG_Lindaa07"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_Lindaa07.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_Lindaa07_r(self):
-        cname = "SVG_Lindaa07_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_Lindaa07.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_bhw3_22(self):
-        cname = "SVG_bhw3_22"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_bhw3_22.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_bhw3_22_r(self):
-        cname = "SVG_bhw3_22_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_bhw3_22.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_es_landscape_79(self):
-        cname = "SVG_es_landscape_79"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_es_landscape_79.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_es_landscape_79_r(self):
-        cname = "SVG_es_landscape_79_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_es_landscape_79.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_feb_sunrise(self):
-        cname = "SVG_feb_sunrise"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_feb_sunrise.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_feb_sunrise_r(self):
-        cname = "SVG_feb_sunrise_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_feb_sunrise.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_foggy_sunrise(self):
-        cname = "SVG_foggy_sunrise"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_foggy_sunrise.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_foggy_sunrise_r(self):
-        cname = "SVG_foggy_sunrise_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_foggy_sunrise.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_fs2006(self):
-        cname = "SVG_fs2006"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_fs2006.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVG_fs2006_r(self):
-        cname = "SVG_fs2006_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "SVG_fs2006.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def StepSeq25(self):
-        cname = "StepSeq25"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "StepSeq25.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def StepSeq25_r(self):
-        cname = "StepSeq25_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "StepSeq25.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def UKM_hadcrut(self):
-        cname = "UKM_hadcrut"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "UKM_hadcrut_10.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def UKM_hadcrut_r(self):
-        cname = "UKM_hadcrut_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "UKM_hadcrut_10.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def ViBlGrWhYeOrRe(self):
-        cname = "ViBlGrWhYeOrRe"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "ViBlGrWhYeOrRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def ViBlGrWhYeOrRe_r(self):
-        cname = "ViBlGrWhYeOrRe_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "ViBlGrWhYeOrRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhBlGrYeRe(self):
-        cname = "WhBlGrYeRe"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhBlGrYeRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhBlGrYeRe_r(self):
-        cname = "WhBlGrYeRe_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhBlGrYeRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhBlReWh(self):
-        cname = "WhBlReWh"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhBlReWh.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhBlReWh_r(self):
-        cname = "WhBlReWh_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhBlReWh.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhViBlGrYeOrRe(self):
-        cname = "WhViBlGrYeOrRe"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhViBlGrYeOrRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhViBlGrYeOrRe_r(self):
-        cname = "WhViBlGrYeOrRe_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhViBlGrYeOrRe.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhViBlGrYeOrReWh(self):
-        cname = "WhViBlGrYeOrReWh"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhViBlGrYeOrReWh.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhViBlGrYeOrReWh_r(self):
-        cname = "WhViBlGrYeOrReWh_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhViBlGrYeOrReWh.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhiteBlue(self):
-        cname = "WhiteBlue"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhiteBlue.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhiteBlue_r(self):
-        cname = "WhiteBlue_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhiteBlue.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhiteBlueGreenYellowRed(self):
-        cname = "WhiteBlueGreenYellowRed"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhiteBlueGreenYellowRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhiteBlueGreenYellowRed_r(self):
-        cname = "WhiteBlueGreenYellowRed_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhiteBlueGreenYellowRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhiteGreen(self):
-        cname = "WhiteGreen"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhiteGreen.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhiteGreen_r(self):
-        cname = "WhiteGreen_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhiteGreen.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhiteYellowOrangeRed(self):
-        cname = "WhiteYellowOrangeRed"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhiteYellowOrangeRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def WhiteYellowOrangeRed_r(self):
-        cname = "WhiteYellowOrangeRed_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "WhiteYellowOrangeRed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def amwg(self):
-        cname = "amwg"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "amwg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def amwg_r(self):
-        cname = "amwg_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "amwg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def amwg256(self):
-        cname = "amwg256"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "amwg256.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def amwg256_r(self):
-        cname = "amwg256_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "amwg256.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def amwg_blueyellowred(self):
-        cname = "amwg_blueyellowred"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "amwg_blueyellowred.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def amwg_blueyellowred_r(self):
-        cname = "amwg_blueyellowred_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "amwg_blueyellowred.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cb_9step(self):
-        cname = "cb_9step"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cb_9step.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cb_9step_r(self):
-        cname = "cb_9step_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cb_9step.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cb_rainbow(self):
-        cname = "cb_rainbow"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cb_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cb_rainbow_r(self):
-        cname = "cb_rainbow_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cb_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cb_rainbow_inv(self):
-        cname = "cb_rainbow_inv"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cb_rainbow_inv.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cb_rainbow_inv_r(self):
-        cname = "cb_rainbow_inv_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cb_rainbow_inv.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def circular_0(self):
-        cname = "circular_0"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "circular_0.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def circular_0_r(self):
-        cname = "circular_0_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "circular_0.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def circular_1(self):
-        cname = "circular_1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "circular_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def circular_1_r(self):
-        cname = "circular_1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "circular_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def circular_2(self):
-        cname = "circular_2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "circular_2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def circular_2_r(self):
-        cname = "circular_2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "circular_2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cividis(self):
-        cname = "cividis"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cividis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cividis_r(self):
-        cname = "cividis_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cividis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_algae(self):
-        cname = "cmocean_algae"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_algae.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_algae_r(self):
-        cname = "cmocean_algae_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_algae.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_amp(self):
-        cname = "cmocean_amp"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_amp.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_amp_r(self):
-        cname = "cmocean_amp_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_amp.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_balance(self):
-        cname = "cmocean_balance"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_balance.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_balance_r(self):
-        cname = "cmocean_balance_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_balance.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_curl(self):
-        cname = "cmocean_curl"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_curl.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_curl_r(self):
-        cname = "cmocean_curl_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_curl.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_deep(self):
-        cname = "cmocean_deep"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_deep.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_deep_r(self):
-        cname = "cmocean_deep_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_deep.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_delta(self):
-        cname = "cmocean_delta"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_delta.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_delta_r(self):
-        cname = "cmocean_delta_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_delta.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_dense(self):
-        cname = "cmocean_dense"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_dense.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_dense_r(self):
-        cname = "cmocean_dense_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_dense.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_gray(self):
-        cname = "cmocean_gray"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_gray_r(self):
-        cname = "cmocean_gray_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_haline(self):
-        cname = "cmocean_haline"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_haline.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_haline_r(self):
-        cname = "cmocean_haline_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_haline.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_ice(self):
-        cname = "cmocean_ice"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_ice.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_ice_r(self):
-        cname = "cmocean_ice_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_ice.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_matter(self):
-        cname = "cmocean_matter"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_matter.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_matter_r(self):
-        cname = "cmocean_matter_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_matter.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_oxy(self):
-        cname = "cmocean_oxy"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_oxy.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_oxy_r(self):
-        cname = "cmocean_oxy_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_oxy.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_phase(self):
-        cname = "cmocean_phase"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_phase.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_phase_r(self):
-        cname = "cmocean_phase_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_phase.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_solar(self):
-        cname = "cmocean_solar"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_solar.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_solar_r(self):
-        cname = "cmocean_solar_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_solar.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_speed(self):
-        cname = "cmocean_speed"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_speed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_speed_r(self):
-        cname = "cmocean_speed_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_speed.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_tempo(self):
-        cname = "cmocean_tempo"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_tempo.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_tempo_r(self):
-        cname = "cmocean_tempo_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_tempo.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_thermal(self):
-        cname = "cmocean_thermal"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_thermal.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_thermal_r(self):
-        cname = "cmocean_thermal_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_thermal.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_turbid(self):
-        cname = "cmocean_turbid"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_turbid.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmocean_turbid_r(self):
-        cname = "cmocean_turbid_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmocean_turbid.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmp_b2r(self):
-        cname = "cmp_b2r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmp_b2r.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmp_b2r_r(self):
-        cname = "cmp_b2r_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmp_b2r.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmp_flux(self):
-        cname = "cmp_flux"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmp_flux.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmp_flux_r(self):
-        cname = "cmp_flux_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmp_flux.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmp_haxby(self):
-        cname = "cmp_haxby"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmp_haxby.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmp_haxby_r(self):
-        cname = "cmp_haxby_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cmp_haxby.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cosam(self):
-        cname = "cosam"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cosam.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cosam_r(self):
-        cname = "cosam_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cosam.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cosam12(self):
-        cname = "cosam12"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cosam12.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cosam12_r(self):
-        cname = "cosam12_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cosam12.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cyclic(self):
-        cname = "cyclic"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cyclic.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cyclic_r(self):
-        cname = "cyclic_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "cyclic.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def default(self):
-        cname = "default"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def default_r(self):
-        cname = "default_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def detail(self):
-        cname = "detail"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "detail.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def detail_r(self):
-        cname = "detail_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "detail.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def drought_severity(self):
-        cname = "drought_severity"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "drought_severity.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def drought_severity_r(self):
-        cname = "drought_severity_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "drought_severity.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def example(self):
-        cname = "example"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "example.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def example_r(self):
-        cname = "example_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "example.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def extrema(self):
-        cname = "extrema"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "extrema.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def extrema_r(self):
-        cname = "extrema_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "extrema.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def grads_default(self):
-        cname = "grads_default"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "grads_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def grads_default_r(self):
-        cname = "grads_default_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "grads_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def grads_rainbow(self):
-        cname = "grads_rainbow"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "grads_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def grads_rainbow_r(self):
-        cname = "grads_rainbow_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "grads_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def gscyclic(self):
-        cname = "gscyclic"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "gscyclic.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def gscyclic_r(self):
-        cname = "gscyclic_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "gscyclic.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def gsdtol(self):
-        cname = "gsdtol"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "gsdtol.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def gsdtol_r(self):
-        cname = "gsdtol_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "gsdtol.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def gsltod(self):
-        cname = "gsltod"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "gsltod.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def gsltod_r(self):
-        cname = "gsltod_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "gsltod.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def gui_default(self):
-        cname = "gui_default"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "gui_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def gui_default_r(self):
-        cname = "gui_default_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "gui_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def helix(self):
-        cname = "helix"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "helix.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def helix_r(self):
-        cname = "helix_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "helix.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def helix1(self):
-        cname = "helix1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "helix1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def helix1_r(self):
-        cname = "helix1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "helix1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def hlu_default(self):
-        cname = "hlu_default"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "hlu_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def hlu_default_r(self):
-        cname = "hlu_default_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "hlu_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def hotcold_18lev(self):
-        cname = "hotcold_18lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "hotcold_18lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def hotcold_18lev_r(self):
-        cname = "hotcold_18lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "hotcold_18lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def hotcolr_19lev(self):
-        cname = "hotcolr_19lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "hotcolr_19lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def hotcolr_19lev_r(self):
-        cname = "hotcolr_19lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "hotcolr_19lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def hotres(self):
-        cname = "hotres"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "hotres.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def hotres_r(self):
-        cname = "hotres_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "hotres.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def lithology(self):
-        cname = "lithology"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "lithology.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def lithology_r(self):
-        cname = "lithology_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "lithology.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def matlab_hot(self):
-        cname = "matlab_hot"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "matlab_hot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def matlab_hot_r(self):
-        cname = "matlab_hot_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "matlab_hot.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def matlab_hsv(self):
-        cname = "matlab_hsv"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "matlab_hsv.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def matlab_hsv_r(self):
-        cname = "matlab_hsv_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "matlab_hsv.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def matlab_jet(self):
-        cname = "matlab_jet"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "matlab_jet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def matlab_jet_r(self):
-        cname = "matlab_jet_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "matlab_jet.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def matlab_lines(self):
-        cname = "matlab_lines"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "matlab_lines.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def matlab_lines_r(self):
-        cname = "matlab_lines_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "matlab_lines.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def mch_default(self):
-        cname = "mch_default"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "mch_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def mch_default_r(self):
-        cname = "mch_default_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "mch_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def ncl_default(self):
-        cname = "ncl_default"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "ncl_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def ncl_default_r(self):
-        cname = "ncl_default_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "ncl_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def ncview_default(self):
-        cname = "ncview_default"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "ncview_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def ncview_default_r(self):
-        cname = "ncview_default_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "ncview_default.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def nice_gfdl(self):
-        cname = "nice_gfdl"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "nice_gfdl.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def nice_gfdl_r(self):
-        cname = "nice_gfdl_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "nice_gfdl.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def nrl_sirkes(self):
-        cname = "nrl_sirkes"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "nrl_sirkes.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def nrl_sirkes_r(self):
-        cname = "nrl_sirkes_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "nrl_sirkes.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def nrl_sirkes_nowhite(self):
-        cname = "nrl_sirkes_nowhite"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "nrl_sirkes_nowhite.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def nrl_sirkes_nowhite_r(self):
-        cname = "nrl_sirkes_nowhite_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "nrl_sirkes_nowhite.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def perc2_9lev(self):
-        cname = "perc2_9lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "perc2_9lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def perc2_9lev_r(self):
-        cname = "perc2_9lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "perc2_9lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def percent_11lev(self):
-        cname = "percent_11lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "percent_11lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def percent_11lev_r(self):
-        cname = "percent_11lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "percent_11lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def posneg_1(self):
-        cname = "posneg_1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "posneg_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def posneg_1_r(self):
-        cname = "posneg_1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "posneg_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def posneg_2(self):
-        cname = "posneg_2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "posneg_2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def posneg_2_r(self):
-        cname = "posneg_2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "posneg_2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def prcp_1(self):
-        cname = "prcp_1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "prcp_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def prcp_1_r(self):
-        cname = "prcp_1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "prcp_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def prcp_2(self):
-        cname = "prcp_2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "prcp_2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def prcp_2_r(self):
-        cname = "prcp_2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "prcp_2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def prcp_3(self):
-        cname = "prcp_3"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "prcp_3.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def prcp_3_r(self):
-        cname = "prcp_3_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "prcp_3.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip2_15lev(self):
-        cname = "precip2_15lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip2_15lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip2_15lev_r(self):
-        cname = "precip2_15lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip2_15lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip2_17lev(self):
-        cname = "precip2_17lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip2_17lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip2_17lev_r(self):
-        cname = "precip2_17lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip2_17lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip3_16lev(self):
-        cname = "precip3_16lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip3_16lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip3_16lev_r(self):
-        cname = "precip3_16lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip3_16lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip4_11lev(self):
-        cname = "precip4_11lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip4_11lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip4_11lev_r(self):
-        cname = "precip4_11lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip4_11lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip4_diff_19lev(self):
-        cname = "precip4_diff_19lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip4_diff_19lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip4_diff_19lev_r(self):
-        cname = "precip4_diff_19lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip4_diff_19lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip_11lev(self):
-        cname = "precip_11lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip_11lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip_11lev_r(self):
-        cname = "precip_11lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip_11lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip_diff_12lev(self):
-        cname = "precip_diff_12lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip_diff_12lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip_diff_12lev_r(self):
-        cname = "precip_diff_12lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip_diff_12lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip_diff_1lev(self):
-        cname = "precip_diff_1lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip_diff_1lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def precip_diff_1lev_r(self):
-        cname = "precip_diff_1lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "precip_diff_1lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def psgcap(self):
-        cname = "psgcap"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "psgcap.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def psgcap_r(self):
-        cname = "psgcap_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "psgcap.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def radar(self):
-        cname = "radar"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "radar.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def radar_r(self):
-        cname = "radar_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "radar.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def radar_1(self):
-        cname = "radar_1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "radar_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def radar_1_r(self):
-        cname = "radar_1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "radar_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_rainbow_gray(self):
-        cname = "cmaps_rainbow_gray"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rainbow+gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_rainbow_gray_r(self):
-        cname = "cmaps_rainbow_gray_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rainbow+gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_rainbow_white_gray(self):
-        cname = "cmaps_rainbow_white_gray"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rainbow+white+gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_rainbow_white_gray_r(self):
-        cname = "cmaps_rainbow_white_gray_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rainbow+white+gray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_rainbow_white(self):
-        cname = "cmaps_rainbow_white"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rainbow+white.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_rainbow_white_r(self):
-        cname = "cmaps_rainbow_white_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rainbow+white.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def rainbow(self):
-        cname = "rainbow"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def rainbow_r(self):
-        cname = "rainbow_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def rh_19lev(self):
-        cname = "rh_19lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rh_19lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def rh_19lev_r(self):
-        cname = "rh_19lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "rh_19lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def seaice_1(self):
-        cname = "seaice_1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "seaice_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def seaice_1_r(self):
-        cname = "seaice_1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "seaice_1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def seaice_2(self):
-        cname = "seaice_2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "seaice_2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def seaice_2_r(self):
-        cname = "seaice_2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "seaice_2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def so4_21(self):
-        cname = "so4_21"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "so4_21.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def so4_21_r(self):
-        cname = "so4_21_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "so4_21.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def so4_23(self):
-        cname = "so4_23"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "so4_23.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def so4_23_r(self):
-        cname = "so4_23_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "so4_23.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def spread_15lev(self):
-        cname = "spread_15lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "spread_15lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def spread_15lev_r(self):
-        cname = "spread_15lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "spread_15lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def srip_reanalysis(self):
-        cname = "srip_reanalysis"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "srip_reanalysis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def srip_reanalysis_r(self):
-        cname = "srip_reanalysis_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "srip_reanalysis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def sunshine_9lev(self):
-        cname = "sunshine_9lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "sunshine_9lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def sunshine_9lev_r(self):
-        cname = "sunshine_9lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "sunshine_9lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def sunshine_diff_12lev(self):
-        cname = "sunshine_diff_12lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "sunshine_diff_12lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def sunshine_diff_12lev_r(self):
-        cname = "sunshine_diff_12lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "sunshine_diff_12lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def t2m_29lev(self):
-        cname = "t2m_29lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "t2m_29lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def t2m_29lev_r(self):
-        cname = "t2m_29lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "t2m_29lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def tbrAvg1(self):
-        cname = "tbrAvg1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbrAvg1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def tbrAvg1_r(self):
-        cname = "tbrAvg1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbrAvg1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def tbrStd1(self):
-        cname = "tbrStd1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbrStd1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def tbrStd1_r(self):
-        cname = "tbrStd1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbrStd1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def tbrVar1(self):
-        cname = "tbrVar1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbrVar1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def tbrVar1_r(self):
-        cname = "tbrVar1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbrVar1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_tbr_240_300(self):
-        cname = "cmaps_tbr_240_300"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbr_240-300.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_tbr_240_300_r(self):
-        cname = "cmaps_tbr_240_300_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbr_240-300.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_tbr_stdev_0_30(self):
-        cname = "cmaps_tbr_stdev_0_30"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbr_stdev_0-30.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_tbr_stdev_0_30_r(self):
-        cname = "cmaps_tbr_stdev_0_30_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbr_stdev_0-30.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_tbr_var_0_500(self):
-        cname = "cmaps_tbr_var_0_500"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbr_var_0-500.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_tbr_var_0_500_r(self):
-        cname = "cmaps_tbr_var_0_500_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "tbr_var_0-500.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def temp1(self):
-        cname = "temp1"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "temp1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def temp1_r(self):
-        cname = "temp1_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "temp1.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def temp_19lev(self):
-        cname = "temp_19lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "temp_19lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def temp_19lev_r(self):
-        cname = "temp_19lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "temp_19lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def temp_diff_18lev(self):
-        cname = "temp_diff_18lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "temp_diff_18lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def temp_diff_18lev_r(self):
-        cname = "temp_diff_18lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "temp_diff_18lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def temp_diff_1lev(self):
-        cname = "temp_diff_1lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "temp_diff_1lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def temp_diff_1lev_r(self):
-        cname = "temp_diff_1lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "temp_diff_1lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def testcmap(self):
-        cname = "testcmap"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "testcmap.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def testcmap_r(self):
-        cname = "testcmap_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "testcmap.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def thelix(self):
-        cname = "thelix"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "thelix.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def thelix_r(self):
-        cname = "thelix_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "thelix.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def topo_15lev(self):
-        cname = "topo_15lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "topo_15lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def topo_15lev_r(self):
-        cname = "topo_15lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "topo_15lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def uniform(self):
-        cname = "uniform"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "uniform.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def uniform_r(self):
-        cname = "uniform_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "uniform.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def vegetation_ClarkU(self):
-        cname = "vegetation_ClarkU"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "vegetation_ClarkU.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def vegetation_ClarkU_r(self):
-        cname = "vegetation_ClarkU_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "vegetation_ClarkU.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def vegetation_modis(self):
-        cname = "vegetation_modis"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "vegetation_modis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def vegetation_modis_r(self):
-        cname = "vegetation_modis_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "vegetation_modis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def wgne15(self):
-        cname = "wgne15"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "wgne15.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def wgne15_r(self):
-        cname = "wgne15_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "wgne15.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_wh_bl_gr_ye_re(self):
-        cname = "cmaps_wh_bl_gr_ye_re"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "wh-bl-gr-ye-re.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def cmaps_wh_bl_gr_ye_re_r(self):
-        cname = "cmaps_wh_bl_gr_ye_re_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "wh-bl-gr-ye-re.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def wind_17lev(self):
-        cname = "wind_17lev"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "wind_17lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def wind_17lev_r(self):
-        cname = "wind_17lev_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "wind_17lev.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def wxpEnIR(self):
-        cname = "wxpEnIR"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "wxpEnIR.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def wxpEnIR_r(self):
-        cname = "wxpEnIR_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "ncar_ncl", "wxpEnIR.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def Carbone42(self):
-        cname = "Carbone42"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "Carbone42.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def Carbone42_r(self):
-        cname = "Carbone42_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "Carbone42.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NMCRef(self):
-        cname = "NMCRef"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NMCRef.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NMCRef_r(self):
-        cname = "NMCRef_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NMCRef.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NMCVel2(self):
-        cname = "NMCVel2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NMCVel2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NMCVel2_r(self):
-        cname = "NMCVel2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NMCVel2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NWSRef(self):
-        cname = "NWSRef"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NWSRef.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NWSRef_r(self):
-        cname = "NWSRef_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NWSRef.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NWSSPW(self):
-        cname = "NWSSPW"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NWSSPW.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NWSSPW_r(self):
-        cname = "NWSSPW_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NWSSPW.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NWSVel(self):
-        cname = "NWSVel"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NWSVel.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NWSVel_r(self):
-        cname = "NWSVel_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NWSVel.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def TopoGray(self):
-        cname = "TopoGray"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "TopoGray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def TopoGray_r(self):
-        cname = "TopoGray_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "TopoGray.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def TwoClass(self):
-        cname = "TwoClass"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "TwoClass.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def TwoClass_r(self):
-        cname = "TwoClass_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "TwoClass.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def mask(self):
-        cname = "mask"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "mask.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def mask_r(self):
-        cname = "mask_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "mask.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_seis(self):
-        cname = "GMT_seis"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_seis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_seis_r(self):
-        cname = "GMT_seis_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_seis.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_relief(self):
-        cname = "GMT_relief"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_relief.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_relief_r(self):
-        cname = "GMT_relief_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_relief.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_earth(self):
-        cname = "GMT_earth"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_earth.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_earth_r(self):
-        cname = "GMT_earth_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_earth.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NYT_drought(self):
-        cname = "NYT_drought"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NYT_drought.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NYT_drought_r(self):
-        cname = "NYT_drought_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NYT_drought.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def UKM_hadcrut_10(self):
-        cname = "UKM_hadcrut_10"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "UKM_hadcrut_10.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def UKM_hadcrut_10_r(self):
-        cname = "UKM_hadcrut_10_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "UKM_hadcrut_10.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVS_tempanomaly(self):
-        cname = "SVS_tempanomaly"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "SVS_tempanomaly.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVS_tempanomaly_r(self):
-        cname = "SVS_tempanomaly_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "SVS_tempanomaly.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_split(self):
-        cname = "GMT_split"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_split.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_split_r(self):
-        cname = "GMT_split_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_split.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_aura_omi_formal(self):
-        cname = "EO_aura_omi_formal"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_aura_omi_formal.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_aura_omi_formal_r(self):
-        cname = "EO_aura_omi_formal_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_aura_omi_formal.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_carbon_density(self):
-        cname = "EO_carbon_density"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_carbon_density.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_carbon_density_r(self):
-        cname = "EO_carbon_density_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_carbon_density.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_lightning_lis_otd(self):
-        cname = "EO_lightning_lis_otd"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_lightning_lis_otd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_lightning_lis_otd_r(self):
-        cname = "EO_lightning_lis_otd_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_lightning_lis_otd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_sargassum_tamo(self):
-        cname = "EO_sargassum_tamo"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_sargassum_tamo.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_sargassum_tamo_r(self):
-        cname = "EO_sargassum_tamo_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_sargassum_tamo.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_soil_moist_div(self):
-        cname = "EO_soil_moist_div"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_soil_moist_div.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_soil_moist_div_r(self):
-        cname = "EO_soil_moist_div_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_soil_moist_div.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_temp_anom_4(self):
-        cname = "EO_temp_anom_4"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_temp_anom_4.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EO_temp_anom_4_r(self):
-        cname = "EO_temp_anom_4_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EO_temp_anom_4.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EVL_wind_anom(self):
-        cname = "EVL_wind_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EVL_wind_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def EVL_wind_anom_r(self):
-        cname = "EVL_wind_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "EVL_wind_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GISS_isccp_rainbow(self):
-        cname = "GISS_isccp_rainbow"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GISS_isccp_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GISS_isccp_rainbow_r(self):
-        cname = "GISS_isccp_rainbow_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GISS_isccp_rainbow.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GISS_isccp_rainbow_20(self):
-        cname = "GISS_isccp_rainbow_20"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GISS_isccp_rainbow_20.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GISS_isccp_rainbow_20_r(self):
-        cname = "GISS_isccp_rainbow_20_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GISS_isccp_rainbow_20.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_seis_20(self):
-        cname = "GMT_seis_20"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_seis_20.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def GMT_seis_20_r(self):
-        cname = "GMT_seis_20_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "GMT_seis_20.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MRO_ice_freq(self):
-        cname = "MRO_ice_freq"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "MRO_ice_freq.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def MRO_ice_freq_r(self):
-        cname = "MRO_ice_freq_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "MRO_ice_freq.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCDC_snow_anom(self):
-        cname = "NCDC_snow_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NCDC_snow_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCDC_snow_anom_r(self):
-        cname = "NCDC_snow_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NCDC_snow_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCDC_temp_anom_f(self):
-        cname = "NCDC_temp_anom_f"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NCDC_temp_anom_f.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NCDC_temp_anom_f_r(self):
-        cname = "NCDC_temp_anom_f_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NCDC_temp_anom_f.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_albedo_change(self):
-        cname = "NEO_albedo_change"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_albedo_change.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_albedo_change_r(self):
-        cname = "NEO_albedo_change_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_albedo_change.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_amsre_ss(self):
-        cname = "NEO_amsre_ss"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_amsre_ss.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_amsre_ss_r(self):
-        cname = "NEO_amsre_ss_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_amsre_ss.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_amsre_sst_anom(self):
-        cname = "NEO_amsre_sst_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_amsre_sst_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_amsre_sst_anom_r(self):
-        cname = "NEO_amsre_sst_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_amsre_sst_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_aod_diff(self):
-        cname = "NEO_aod_diff"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_aod_diff.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_aod_diff_r(self):
-        cname = "NEO_aod_diff_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_aod_diff.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_aquarius_sss(self):
-        cname = "NEO_aquarius_sss"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_aquarius_sss.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_aquarius_sss_r(self):
-        cname = "NEO_aquarius_sss_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_aquarius_sss.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_bright_temp(self):
-        cname = "NEO_bright_temp"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_bright_temp.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_bright_temp_r(self):
-        cname = "NEO_bright_temp_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_bright_temp.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_carb_emit_anom(self):
-        cname = "NEO_carb_emit_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_carb_emit_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_carb_emit_anom_r(self):
-        cname = "NEO_carb_emit_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_carb_emit_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_cdom(self):
-        cname = "NEO_cdom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_cdom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_cdom_r(self):
-        cname = "NEO_cdom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_cdom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ceres_insol(self):
-        cname = "NEO_ceres_insol"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ceres_insol.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ceres_insol_r(self):
-        cname = "NEO_ceres_insol_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ceres_insol.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ceres_lw(self):
-        cname = "NEO_ceres_lw"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ceres_lw.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ceres_lw_r(self):
-        cname = "NEO_ceres_lw_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ceres_lw.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ceres_ne(self):
-        cname = "NEO_ceres_ne"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ceres_ne.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ceres_ne_r(self):
-        cname = "NEO_ceres_ne_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ceres_ne.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ceres_sw(self):
-        cname = "NEO_ceres_sw"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ceres_sw.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ceres_sw_r(self):
-        cname = "NEO_ceres_sw_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ceres_sw.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_chlorophyll(self):
-        cname = "NEO_chlorophyll"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_chlorophyll.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_chlorophyll_r(self):
-        cname = "NEO_chlorophyll_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_chlorophyll.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_chlorophyll_o(self):
-        cname = "NEO_chlorophyll_o"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_chlorophyll_o.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_chlorophyll_o_r(self):
-        cname = "NEO_chlorophyll_o_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_chlorophyll_o.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_div_vegetation_(self):
-        cname = "NEO_div_vegetation_"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_div_vegetation_.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_div_vegetation__r(self):
-        cname = "NEO_div_vegetation__r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_div_vegetation_.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_evapstress(self):
-        cname = "NEO_evapstress"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_evapstress.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_evapstress_r(self):
-        cname = "NEO_evapstress_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_evapstress.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_gebco_bathymetry(self):
-        cname = "NEO_gebco_bathymetry"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_gebco_bathymetry.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_gebco_bathymetry_r(self):
-        cname = "NEO_gebco_bathymetry_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_gebco_bathymetry.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ggmcf(self):
-        cname = "NEO_ggmcf"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ggmcf.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ggmcf_r(self):
-        cname = "NEO_ggmcf_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ggmcf.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_giss_temp_anom(self):
-        cname = "NEO_giss_temp_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_giss_temp_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_giss_temp_anom_r(self):
-        cname = "NEO_giss_temp_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_giss_temp_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_grace_lwe_anom(self):
-        cname = "NEO_grace_lwe_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_grace_lwe_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_grace_lwe_anom_r(self):
-        cname = "NEO_grace_lwe_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_grace_lwe_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_grav_anom(self):
-        cname = "NEO_grav_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_grav_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_grav_anom_r(self):
-        cname = "NEO_grav_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_grav_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_imperv_surf(self):
-        cname = "NEO_imperv_surf"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_imperv_surf.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_imperv_surf_r(self):
-        cname = "NEO_imperv_surf_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_imperv_surf.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_meltseason_anom(self):
-        cname = "NEO_meltseason_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_meltseason_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_meltseason_anom_r(self):
-        cname = "NEO_meltseason_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_meltseason_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_aer_od(self):
-        cname = "NEO_modis_aer_od"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_aer_od.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_aer_od_r(self):
-        cname = "NEO_modis_aer_od_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_aer_od.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_bs_albedo(self):
-        cname = "NEO_modis_bs_albedo"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_bs_albedo.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_bs_albedo_r(self):
-        cname = "NEO_modis_bs_albedo_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_bs_albedo.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_chlor(self):
-        cname = "NEO_modis_chlor"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_chlor.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_chlor_r(self):
-        cname = "NEO_modis_chlor_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_chlor.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_ci(self):
-        cname = "NEO_modis_cld_ci"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_ci.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_ci_r(self):
-        cname = "NEO_modis_cld_ci_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_ci.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_fr(self):
-        cname = "NEO_modis_cld_fr"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_fr.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_fr_r(self):
-        cname = "NEO_modis_cld_fr_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_fr.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_o(self):
-        cname = "NEO_modis_cld_o"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_o.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_o_r(self):
-        cname = "NEO_modis_cld_o_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_o.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_rd(self):
-        cname = "NEO_modis_cld_rd"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_rd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_rd_r(self):
-        cname = "NEO_modis_cld_rd_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_rd.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_wp(self):
-        cname = "NEO_modis_cld_wp"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_wp.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_cld_wp_r(self):
-        cname = "NEO_modis_cld_wp_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_cld_wp.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_ls(self):
-        cname = "NEO_modis_ls"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_ls.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_ls_r(self):
-        cname = "NEO_modis_ls_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_ls.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_lst_anom(self):
-        cname = "NEO_modis_lst_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_lst_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_lst_anom_r(self):
-        cname = "NEO_modis_lst_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_lst_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_sky_wv(self):
-        cname = "NEO_modis_sky_wv"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_sky_wv.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_sky_wv_r(self):
-        cname = "NEO_modis_sky_wv_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_sky_wv.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_sst_45(self):
-        cname = "NEO_modis_sst_45"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_sst_45.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_modis_sst_45_r(self):
-        cname = "NEO_modis_sst_45_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_modis_sst_45.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_mopitt_co(self):
-        cname = "NEO_mopitt_co"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_mopitt_co.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_mopitt_co_r(self):
-        cname = "NEO_mopitt_co_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_mopitt_co.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ns_airtemp(self):
-        cname = "NEO_ns_airtemp"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ns_airtemp.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_ns_airtemp_r(self):
-        cname = "NEO_ns_airtemp_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_ns_airtemp.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_omi_no2(self):
-        cname = "NEO_omi_no2"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_omi_no2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_omi_no2_r(self):
-        cname = "NEO_omi_no2_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_omi_no2.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_omi_ozone_to3(self):
-        cname = "NEO_omi_ozone_to3"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_omi_ozone_to3.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_omi_ozone_to3_r(self):
-        cname = "NEO_omi_ozone_to3_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_omi_ozone_to3.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_omi_uvi(self):
-        cname = "NEO_omi_uvi"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_omi_uvi.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_omi_uvi_r(self):
-        cname = "NEO_omi_uvi_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_omi_uvi.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_pollution_conc_9(self):
-        cname = "NEO_pollution_conc_9"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_pollution_conc_9.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_pollution_conc_9_r(self):
-        cname = "NEO_pollution_conc_9_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_pollution_conc_9.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_pollution_mor(self):
-        cname = "NEO_pollution_mor"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_pollution_mor.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_pollution_mor_r(self):
-        cname = "NEO_pollution_mor_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_pollution_mor.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_rainfall_anom_9(self):
-        cname = "NEO_rainfall_anom_9"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_rainfall_anom_9.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_rainfall_anom_9_r(self):
-        cname = "NEO_rainfall_anom_9_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_rainfall_anom_9.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_seasurf_hgt_anom(self):
-        cname = "NEO_seasurf_hgt_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_seasurf_hgt_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_seasurf_hgt_anom_r(self):
-        cname = "NEO_seasurf_hgt_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_seasurf_hgt_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_sedac_pop(self):
-        cname = "NEO_sedac_pop"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_sedac_pop.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_sedac_pop_r(self):
-        cname = "NEO_sedac_pop_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_sedac_pop.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_snow_water(self):
-        cname = "NEO_snow_water"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_snow_water.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_snow_water_r(self):
-        cname = "NEO_snow_water_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_snow_water.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_soil_moisture(self):
-        cname = "NEO_soil_moisture"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_soil_moisture.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_soil_moisture_r(self):
-        cname = "NEO_soil_moisture_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_soil_moisture.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_soil_moisture_anom(self):
-        cname = "NEO_soil_moisture_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_soil_moisture_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_soil_moisture_anom_r(self):
-        cname = "NEO_soil_moisture_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_soil_moisture_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_soil_moisture_anom_nl(self):
-        cname = "NEO_soil_moisture_anom_nl"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_soil_moisture_anom_nl.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_soil_moisture_anom_nl_r(self):
-        cname = "NEO_soil_moisture_anom_nl_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_soil_moisture_anom_nl.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_soil_moisture_pale(self):
-        cname = "NEO_soil_moisture_pale"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_soil_moisture_pale.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_soil_moisture_pale_r(self):
-        cname = "NEO_soil_moisture_pale_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_soil_moisture_pale.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_srtm_topography(self):
-        cname = "NEO_srtm_topography"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_srtm_topography.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_srtm_topography_r(self):
-        cname = "NEO_srtm_topography_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_srtm_topography.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_tree_cover(self):
-        cname = "NEO_tree_cover"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_tree_cover.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_tree_cover_r(self):
-        cname = "NEO_tree_cover_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_tree_cover.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_trmm_rainfall(self):
-        cname = "NEO_trmm_rainfall"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_trmm_rainfall.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_trmm_rainfall_r(self):
-        cname = "NEO_trmm_rainfall_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_trmm_rainfall.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_wind_spd_anom(self):
-        cname = "NEO_wind_spd_anom"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_wind_spd_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_wind_spd_anom_r(self):
-        cname = "NEO_wind_spd_anom_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_wind_spd_anom.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_wind_spd_anomaly_pwg(self):
-        cname = "NEO_wind_spd_anomaly_pwg"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_wind_spd_anomaly_pwg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def NEO_wind_spd_anomaly_pwg_r(self):
-        cname = "NEO_wind_spd_anomaly_pwg_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "NEO_wind_spd_anomaly_pwg.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVS_soilmoisture(self):
-        cname = "SVS_soilmoisture"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "SVS_soilmoisture.rgb")
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            cmap = Colormap(self._coltbl(cmap_file), name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
-
-    @property
-    def SVS_soilmoisture_r(self):
-        cname = "SVS_soilmoisture_r"
-        try:
-            return get_cmap(cname)
-        except:
-            cmap_file = os.path.join(CMAPSFILE_DIR, "self_defined", "SVS_soilmoisture.rgb")
-            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)
-            register_cmap(name=cname, cmap=cmap)
-            return cmap
+                self._user_cmaps[cname] = (cmap_file, False)
+                self._user_cmaps[cname + '_r'] = (cmap_file, True)
+
+    # colormap name -> (file relative to CMAPSFILE_DIR, reversed)
+    _cmaps = {
+        "N3gauss": ("ncar_ncl/3gauss.rgb", False),
+        "N3gauss_r": ("ncar_ncl/3gauss.rgb", True),
+        "N3saw": ("ncar_ncl/3saw.rgb", False),
+        "N3saw_r": ("ncar_ncl/3saw.rgb", True),
+        "BkBlAqGrYeOrReViWh200": ("ncar_ncl/BkBlAqGrYeOrReViWh200.rgb", False),
+        "BkBlAqGrYeOrReViWh200_r": ("ncar_ncl/BkBlAqGrYeOrReViWh200.rgb", True),
+        "BlAqGrWh2YeOrReVi22": ("ncar_ncl/BlAqGrWh2YeOrReVi22.rgb", False),
+        "BlAqGrWh2YeOrReVi22_r": ("ncar_ncl/BlAqGrWh2YeOrReVi22.rgb", True),
+        "BlAqGrYeOrRe": ("ncar_ncl/BlAqGrYeOrRe.rgb", False),
+        "BlAqGrYeOrRe_r": ("ncar_ncl/BlAqGrYeOrRe.rgb", True),
+        "BlAqGrYeOrReVi200": ("ncar_ncl/BlAqGrYeOrReVi200.rgb", False),
+        "BlAqGrYeOrReVi200_r": ("ncar_ncl/BlAqGrYeOrReVi200.rgb", True),
+        "BlGrYeOrReVi200": ("ncar_ncl/BlGrYeOrReVi200.rgb", False),
+        "BlGrYeOrReVi200_r": ("ncar_ncl/BlGrYeOrReVi200.rgb", True),
+        "BlRe": ("ncar_ncl/BlRe.rgb", False),
+        "BlRe_r": ("ncar_ncl/BlRe.rgb", True),
+        "BlWhRe": ("ncar_ncl/BlWhRe.rgb", False),
+        "BlWhRe_r": ("ncar_ncl/BlWhRe.rgb", True),
+        "BlueDarkOrange18": ("ncar_ncl/BlueDarkOrange18.rgb", False),
+        "BlueDarkOrange18_r": ("ncar_ncl/BlueDarkOrange18.rgb", True),
+        "BlueDarkRed18": ("ncar_ncl/BlueDarkRed18.rgb", False),
+        "BlueDarkRed18_r": ("ncar_ncl/BlueDarkRed18.rgb", True),
+        "BlueGreen14": ("ncar_ncl/BlueGreen14.rgb", False),
+        "BlueGreen14_r": ("ncar_ncl/BlueGreen14.rgb", True),
+        "BlueRed": ("ncar_ncl/BlueRed.rgb", False),
+        "BlueRed_r": ("ncar_ncl/BlueRed.rgb", True),
+        "BlueRedGray": ("ncar_ncl/BlueRedGray.rgb", False),
+        "BlueRedGray_r": ("ncar_ncl/BlueRedGray.rgb", True),
+        "BlueWhiteOrangeRed": ("ncar_ncl/BlueWhiteOrangeRed.rgb", False),
+        "BlueWhiteOrangeRed_r": ("ncar_ncl/BlueWhiteOrangeRed.rgb", True),
+        "BlueYellowRed": ("ncar_ncl/BlueYellowRed.rgb", False),
+        "BlueYellowRed_r": ("ncar_ncl/BlueYellowRed.rgb", True),
+        "BrownBlue12": ("ncar_ncl/BrownBlue12.rgb", False),
+        "BrownBlue12_r": ("ncar_ncl/BrownBlue12.rgb", True),
+        "CBR_coldhot": ("ncar_ncl/CBR_coldhot.rgb", False),
+        "CBR_coldhot_r": ("ncar_ncl/CBR_coldhot.rgb", True),
+        "CBR_drywet": ("ncar_ncl/CBR_drywet.rgb", False),
+        "CBR_drywet_r": ("ncar_ncl/CBR_drywet.rgb", True),
+        "CBR_set3": ("ncar_ncl/CBR_set3.rgb", False),
+        "CBR_set3_r": ("ncar_ncl/CBR_set3.rgb", True),
+        "CBR_wet": ("ncar_ncl/CBR_wet.rgb", False),
+        "CBR_wet_r": ("ncar_ncl/CBR_wet.rgb", True),
+        "Cat12": ("ncar_ncl/Cat12.rgb", False),
+        "Cat12_r": ("ncar_ncl/Cat12.rgb", True),
+        "GHRSST_anomaly": ("ncar_ncl/GHRSST_anomaly.rgb", False),
+        "GHRSST_anomaly_r": ("ncar_ncl/GHRSST_anomaly.rgb", True),
+        "GMT_cool": ("ncar_ncl/GMT_cool.rgb", False),
+        "GMT_cool_r": ("ncar_ncl/GMT_cool.rgb", True),
+        "GMT_copper": ("ncar_ncl/GMT_copper.rgb", False),
+        "GMT_copper_r": ("ncar_ncl/GMT_copper.rgb", True),
+        "GMT_drywet": ("ncar_ncl/GMT_drywet.rgb", False),
+        "GMT_drywet_r": ("ncar_ncl/GMT_drywet.rgb", True),
+        "GMT_gebco": ("ncar_ncl/GMT_gebco.rgb", False),
+        "GMT_gebco_r": ("ncar_ncl/GMT_gebco.rgb", True),
+        "GMT_globe": ("ncar_ncl/GMT_globe.rgb", False),
+        "GMT_globe_r": ("ncar_ncl/GMT_globe.rgb", True),
+        "GMT_gray": ("ncar_ncl/GMT_gray.rgb", False),
+        "GMT_gray_r": ("ncar_ncl/GMT_gray.rgb", True),
+        "GMT_haxby": ("ncar_ncl/GMT_haxby.rgb", False),
+        "GMT_haxby_r": ("ncar_ncl/GMT_haxby.rgb", True),
+        "GMT_hot": ("ncar_ncl/GMT_hot.rgb", False),
+        "GMT_hot_r": ("ncar_ncl/GMT_hot.rgb", True),
+        "GMT_jet": ("ncar_ncl/GMT_jet.rgb", False),
+        "GMT_jet_r": ("ncar_ncl/GMT_jet.rgb", True),
+        "GMT_nighttime": ("ncar_ncl/GMT_nighttime.rgb", False),
+        "GMT_nighttime_r": ("ncar_ncl/GMT_nighttime.rgb", True),
+        "GMT_no_green": ("ncar_ncl/GMT_no_green.rgb", False),
+        "GMT_no_green_r": ("ncar_ncl/GMT_no_green.rgb", True),
+        "GMT_ocean": ("ncar_ncl/GMT_ocean.rgb", False),
+        "GMT_ocean_r": ("ncar_ncl/GMT_ocean.rgb", True),
+        "GMT_paired": ("ncar_ncl/GMT_paired.rgb", False),
+        "GMT_paired_r": ("ncar_ncl/GMT_paired.rgb", True),
+        "GMT_panoply": ("ncar_ncl/GMT_panoply.rgb", False),
+        "GMT_panoply_r": ("ncar_ncl/GMT_panoply.rgb", True),
+        "GMT_polar": ("ncar_ncl/GMT_polar.rgb", False),
+        "GMT_polar_r": ("ncar_ncl/GMT_polar.rgb", True),
+        "GMT_red2green": ("ncar_ncl/GMT_red2green.rgb", False),
+        "GMT_red2green_r": ("ncar_ncl/GMT_red2green.rgb", True),
+        "GMT_relief": ("self_defined/GMT_relief.rgb", False),
+        "GMT_relief_r": ("self_defined/GMT_relief.rgb", True),
+        "GMT_relief_oceanonly": ("ncar_ncl/GMT_relief_oceanonly.rgb", False),
+        "GMT_relief_oceanonly_r": ("ncar_ncl/GMT_relief_oceanonly.rgb", True),
+        "GMT_seis": ("self_defined/GMT_seis.rgb", False),
+        "GMT_seis_r": ("self_defined/GMT_seis.rgb", True),
+        "GMT_split": ("self_defined/GMT_split.rgb", False),
+        "GMT_split_r": ("self_defined/GMT_split.rgb", True),
+        "GMT_topo": ("ncar_ncl/GMT_topo.rgb", False),
+        "GMT_topo_r": ("ncar_ncl/GMT_topo.rgb", True),
+        "GMT_wysiwyg": ("ncar_ncl/GMT_wysiwyg.rgb", False),
+        "GMT_wysiwyg_r": ("ncar_ncl/GMT_wysiwyg.rgb", True),
+        "GMT_wysiwygcont": ("ncar_ncl/GMT_wysiwygcont.rgb", False),
+        "GMT_wysiwygcont_r": ("ncar_ncl/GMT_wysiwygcont.rgb", True),
+        "GSFC_landsat_udf_density": ("ncar_ncl/GSFC_landsat_udf_density.rgb", False),
+        "GSFC_landsat_udf_density_r": ("ncar_ncl/GSFC_landsat_udf_density.rgb", True),
+        "GrayWhiteGray": ("ncar_ncl/GrayWhiteGray.rgb", False),
+        "GrayWhiteGray_r": ("ncar_ncl/GrayWhiteGray.rgb", True),
+        "GreenMagenta16": ("ncar_ncl/GreenMagenta16.rgb", False),
+        "GreenMagenta16_r": ("ncar_ncl/GreenMagenta16.rgb", True),
+        "GreenYellow": ("ncar_ncl/GreenYellow.rgb", False),
+        "GreenYellow_r": ("ncar_ncl/GreenYellow.rgb", True),
+        "MPL_Accent": ("ncar_ncl/MPL_Accent.rgb", False),
+        "MPL_Accent_r": ("ncar_ncl/MPL_Accent.rgb", True),
+        "MPL_Blues": ("ncar_ncl/MPL_Blues.rgb", False),
+        "MPL_Blues_r": ("ncar_ncl/MPL_Blues.rgb", True),
+        "MPL_BrBG": ("ncar_ncl/MPL_BrBG.rgb", False),
+        "MPL_BrBG_r": ("ncar_ncl/MPL_BrBG.rgb", True),
+        "MPL_BuGn": ("ncar_ncl/MPL_BuGn.rgb", False),
+        "MPL_BuGn_r": ("ncar_ncl/MPL_BuGn.rgb", True),
+        "MPL_BuPu": ("ncar_ncl/MPL_BuPu.rgb", False),
+        "MPL_BuPu_r": ("ncar_ncl/MPL_BuPu.rgb", True),
+        "MPL_Dark2": ("ncar_ncl/MPL_Dark2.rgb", False),
+        "MPL_Dark2_r": ("ncar_ncl/MPL_Dark2.rgb", True),
+        "MPL_GnBu": ("ncar_ncl/MPL_GnBu.rgb", False),
+        "MPL_GnBu_r": ("ncar_ncl/MPL_GnBu.rgb", True),
+        "MPL_Greens": ("ncar_ncl/MPL_Greens.rgb", False),
+        "MPL_Greens_r": ("ncar_ncl/MPL_Greens.rgb", True),
+        "MPL_Greys": ("ncar_ncl/MPL_Greys.rgb", False),
+        "MPL_Greys_r": ("ncar_ncl/MPL_Greys.rgb", True),
+        "MPL_OrRd": ("ncar_ncl/MPL_OrRd.rgb", False),
+        "MPL_OrRd_r": ("ncar_ncl/MPL_OrRd.rgb", True),
+        "MPL_Oranges": ("ncar_ncl/MPL_Oranges.rgb", False),
+        "MPL_Oranges_r": ("ncar_ncl/MPL_Oranges.rgb", True),
+        "MPL_PRGn": ("ncar_ncl/MPL_PRGn.rgb", False),
+        "MPL_PRGn_r": ("ncar_ncl/MPL_PRGn.rgb", True),
+        "MPL_Paired": ("ncar_ncl/MPL_Paired.rgb", False),
+        "MPL_Paired_r": ("ncar_ncl/MPL_Paired.rgb", True),
+        "MPL_Pastel1": ("ncar_ncl/MPL_Pastel1.rgb", False),
+        "MPL_Pastel1_r": ("ncar_ncl/MPL_Pastel1.rgb", True),
+        "MPL_Pastel2": ("ncar_ncl/MPL_Pastel2.rgb", False),
+        "MPL_Pastel2_r": ("ncar_ncl/MPL_Pastel2.rgb", True),
+        "MPL_PiYG": ("ncar_ncl/MPL_PiYG.rgb", False),
+        "MPL_PiYG_r": ("ncar_ncl/MPL_PiYG.rgb", True),
+        "MPL_PuBu": ("ncar_ncl/MPL_PuBu.rgb", False),
+        "MPL_PuBu_r": ("ncar_ncl/MPL_PuBu.rgb", True),
+        "MPL_PuBuGn": ("ncar_ncl/MPL_PuBuGn.rgb", False),
+        "MPL_PuBuGn_r": ("ncar_ncl/MPL_PuBuGn.rgb", True),
+        "MPL_PuOr": ("ncar_ncl/MPL_PuOr.rgb", False),
+        "MPL_PuOr_r": ("ncar_ncl/MPL_PuOr.rgb", True),
+        "MPL_PuRd": ("ncar_ncl/MPL_PuRd.rgb", False),
+        "MPL_PuRd_r": ("ncar_ncl/MPL_PuRd.rgb", True),
+        "MPL_Purples": ("ncar_ncl/MPL_Purples.rgb", False),
+        "MPL_Purples_r": ("ncar_ncl/MPL_Purples.rgb", True),
+        "MPL_RdBu": ("ncar_ncl/MPL_RdBu.rgb", False),
+        "MPL_RdBu_r": ("ncar_ncl/MPL_RdBu.rgb", True),
+        "MPL_RdGy": ("ncar_ncl/MPL_RdGy.rgb", False),
+        "MPL_RdGy_r": ("ncar_ncl/MPL_RdGy.rgb", True),
+        "MPL_RdPu": ("ncar_ncl/MPL_RdPu.rgb", False),
+        "MPL_RdPu_r": ("ncar_ncl/MPL_RdPu.rgb", True),
+        "MPL_RdYlBu": ("ncar_ncl/MPL_RdYlBu.rgb", False),
+        "MPL_RdYlBu_r": ("ncar_ncl/MPL_RdYlBu.rgb", True),
+        "MPL_RdYlGn": ("ncar_ncl/MPL_RdYlGn.rgb", False),
+        "MPL_RdYlGn_r": ("ncar_ncl/MPL_RdYlGn.rgb", True),
+        "MPL_Reds": ("ncar_ncl/MPL_Reds.rgb", False),
+        "MPL_Reds_r": ("ncar_ncl/MPL_Reds.rgb", True),
+        "MPL_Set1": ("ncar_ncl/MPL_Set1.rgb", False),
+        "MPL_Set1_r": ("ncar_ncl/MPL_Set1.rgb", True),
+        "MPL_Set2": ("ncar_ncl/MPL_Set2.rgb", False),
+        "MPL_Set2_r": ("ncar_ncl/MPL_Set2.rgb", True),
+        "MPL_Set3": ("ncar_ncl/MPL_Set3.rgb", False),
+        "MPL_Set3_r": ("ncar_ncl/MPL_Set3.rgb", True),
+        "MPL_Spectral": ("ncar_ncl/MPL_Spectral.rgb", False),
+        "MPL_Spectral_r": ("ncar_ncl/MPL_Spectral.rgb", True),
+        "MPL_StepSeq": ("ncar_ncl/MPL_StepSeq.rgb", False),
+        "MPL_StepSeq_r": ("ncar_ncl/MPL_StepSeq.rgb", True),
+        "MPL_YlGn": ("ncar_ncl/MPL_YlGn.rgb", False),
+        "MPL_YlGn_r": ("ncar_ncl/MPL_YlGn.rgb", True),
+        "MPL_YlGnBu": ("ncar_ncl/MPL_YlGnBu.rgb", False),
+        "MPL_YlGnBu_r": ("ncar_ncl/MPL_YlGnBu.rgb", True),
+        "MPL_YlOrBr": ("ncar_ncl/MPL_YlOrBr.rgb", False),
+        "MPL_YlOrBr_r": ("ncar_ncl/MPL_YlOrBr.rgb", True),
+        "MPL_YlOrRd": ("ncar_ncl/MPL_YlOrRd.rgb", False),
+        "MPL_YlOrRd_r": ("ncar_ncl/MPL_YlOrRd.rgb", True),
+        "MPL_afmhot": ("ncar_ncl/MPL_afmhot.rgb", False),
+        "MPL_afmhot_r": ("ncar_ncl/MPL_afmhot.rgb", True),
+        "MPL_autumn": ("ncar_ncl/MPL_autumn.rgb", False),
+        "MPL_autumn_r": ("ncar_ncl/MPL_autumn.rgb", True),
+        "MPL_bone": ("ncar_ncl/MPL_bone.rgb", False),
+        "MPL_bone_r": ("ncar_ncl/MPL_bone.rgb", True),
+        "MPL_brg": ("ncar_ncl/MPL_brg.rgb", False),
+        "MPL_brg_r": ("ncar_ncl/MPL_brg.rgb", True),
+        "MPL_bwr": ("ncar_ncl/MPL_bwr.rgb", False),
+        "MPL_bwr_r": ("ncar_ncl/MPL_bwr.rgb", True),
+        "MPL_cool": ("ncar_ncl/MPL_cool.rgb", False),
+        "MPL_cool_r": ("ncar_ncl/MPL_cool.rgb", True),
+        "MPL_coolwarm": ("ncar_ncl/MPL_coolwarm.rgb", False),
+        "MPL_coolwarm_r": ("ncar_ncl/MPL_coolwarm.rgb", True),
+        "MPL_copper": ("ncar_ncl/MPL_copper.rgb", False),
+        "MPL_copper_r": ("ncar_ncl/MPL_copper.rgb", True),
+        "MPL_cubehelix": ("ncar_ncl/MPL_cubehelix.rgb", False),
+        "MPL_cubehelix_r": ("ncar_ncl/MPL_cubehelix.rgb", True),
+        "MPL_flag": ("ncar_ncl/MPL_flag.rgb", False),
+        "MPL_flag_r": ("ncar_ncl/MPL_flag.rgb", True),
+        "MPL_gist_earth": ("ncar_ncl/MPL_gist_earth.rgb", False),
+        "MPL_gist_earth_r": ("ncar_ncl/MPL_gist_earth.rgb", True),
+        "MPL_gist_gray": ("ncar_ncl/MPL_gist_gray.rgb", False),
+        "MPL_gist_gray_r": ("ncar_ncl/MPL_gist_gray.rgb", True),
+        "MPL_gist_heat": ("ncar_ncl/MPL_gist_heat.rgb", False),
+        "MPL_gist_heat_r": ("ncar_ncl/MPL_gist_heat.rgb", True),
+        "MPL_gist_ncar": ("ncar_ncl/MPL_gist_ncar.rgb", False),
+        "MPL_gist_ncar_r": ("ncar_ncl/MPL_gist_ncar.rgb", True),
+        "MPL_gist_rainbow": ("ncar_ncl/MPL_gist_rainbow.rgb", False),
+        "MPL_gist_rainbow_r": ("ncar_ncl/MPL_gist_rainbow.rgb", True),
+        "MPL_gist_stern": ("ncar_ncl/MPL_gist_stern.rgb", False),
+        "MPL_gist_stern_r": ("ncar_ncl/MPL_gist_stern.rgb", True),
+        "MPL_gist_yarg": ("ncar_ncl/MPL_gist_yarg.rgb", False),
+        "MPL_gist_yarg_r": ("ncar_ncl/MPL_gist_yarg.rgb", True),
+        "MPL_gnuplot": ("ncar_ncl/MPL_gnuplot.rgb", False),
+        "MPL_gnuplot_r": ("ncar_ncl/MPL_gnuplot.rgb", True),
+        "MPL_gnuplot2": ("ncar_ncl/MPL_gnuplot2.rgb", False),
+        "MPL_gnuplot2_r": ("ncar_ncl/MPL_gnuplot2.rgb", True),
+        "MPL_hot": ("ncar_ncl/MPL_hot.rgb", False),
+        "MPL_hot_r": ("ncar_ncl/MPL_hot.rgb", True),
+        "MPL_hsv": ("ncar_ncl/MPL_hsv.rgb", False),
+        "MPL_hsv_r": ("ncar_ncl/MPL_hsv.rgb", True),
+        "MPL_jet": ("ncar_ncl/MPL_jet.rgb", False),
+        "MPL_jet_r": ("ncar_ncl/MPL_jet.rgb", True),
+        "MPL_ocean": ("ncar_ncl/MPL_ocean.rgb", False),
+        "MPL_ocean_r": ("ncar_ncl/MPL_ocean.rgb", True),
+        "MPL_pink": ("ncar_ncl/MPL_pink.rgb", False),
+        "MPL_pink_r": ("ncar_ncl/MPL_pink.rgb", True),
+        "MPL_prism": ("ncar_ncl/MPL_prism.rgb", False),
+        "MPL_prism_r": ("ncar_ncl/MPL_prism.rgb", True),
+        "MPL_rainbow": ("ncar_ncl/MPL_rainbow.rgb", False),
+        "MPL_rainbow_r": ("ncar_ncl/MPL_rainbow.rgb", True),
+        "MPL_s3pcpn": ("ncar_ncl/MPL_s3pcpn.rgb", False),
+        "MPL_s3pcpn_r": ("ncar_ncl/MPL_s3pcpn.rgb", True),
+        "MPL_s3pcpn_l": ("ncar_ncl/MPL_s3pcpn_l.rgb", False),
+        "MPL_s3pcpn_l_r": ("ncar_ncl/MPL_s3pcpn_l.rgb", True),
+        "MPL_seismic": ("ncar_ncl/MPL_seismic.rgb", False),
+        "MPL_seismic_r": ("ncar_ncl/MPL_seismic.rgb", True),
+        "MPL_spring": ("ncar_ncl/MPL_spring.rgb", False),
+        "MPL_spring_r": ("ncar_ncl/MPL_spring.rgb", True),
+        "MPL_sstanom": ("ncar_ncl/MPL_sstanom.rgb", False),
+        "MPL_sstanom_r": ("ncar_ncl/MPL_sstanom.rgb", True),
+        "MPL_summer": ("ncar_ncl/MPL_summer.rgb", False),
+        "MPL_summer_r": ("ncar_ncl/MPL_summer.rgb", True),
+        "MPL_terrain": ("ncar_ncl/MPL_terrain.rgb", False),
+        "MPL_terrain_r": ("ncar_ncl/MPL_terrain.rgb", True),
+        "MPL_viridis": ("ncar_ncl/MPL_viridis.rgb", False),
+        "MPL_viridis_r": ("ncar_ncl/MPL_viridis.rgb", True),
+        "MPL_winter": ("ncar_ncl/MPL_winter.rgb", False),
+        "MPL_winter_r": ("ncar_ncl/MPL_winter.rgb", True),
+        "NCV_banded": ("ncar_ncl/NCV_banded.rgb", False),
+        "NCV_banded_r": ("ncar_ncl/NCV_banded.rgb", True),
+        "NCV_blu_red": ("ncar_ncl/NCV_blu_red.rgb", False),
+        "NCV_blu_red_r": ("ncar_ncl/NCV_blu_red.rgb", True),
+        "NCV_blue_red": ("ncar_ncl/NCV_blue_red.rgb", False),
+        "NCV_blue_red_r": ("ncar_ncl/NCV_blue_red.rgb", True),
+        "NCV_bright": ("ncar_ncl/NCV_bright.rgb", False),
+        "NCV_bright_r": ("ncar_ncl/NCV_bright.rgb", True),
+        "NCV_gebco": ("ncar_ncl/NCV_gebco.rgb", False),
+        "NCV_gebco_r": ("ncar_ncl/NCV_gebco.rgb", True),
+        "NCV_jaisnd": ("ncar_ncl/NCV_jaisnd.rgb", False),
+        "NCV_jaisnd_r": ("ncar_ncl/NCV_jaisnd.rgb", True),
+        "NCV_jet": ("ncar_ncl/NCV_jet.rgb", False),
+        "NCV_jet_r": ("ncar_ncl/NCV_jet.rgb", True),
+        "NCV_manga": ("ncar_ncl/NCV_manga.rgb", False),
+        "NCV_manga_r": ("ncar_ncl/NCV_manga.rgb", True),
+        "NCV_rainbow2": ("ncar_ncl/NCV_rainbow2.rgb", False),
+        "NCV_rainbow2_r": ("ncar_ncl/NCV_rainbow2.rgb", True),
+        "NCV_roullet": ("ncar_ncl/NCV_roullet.rgb", False),
+        "NCV_roullet_r": ("ncar_ncl/NCV_roullet.rgb", True),
+        "NEO_div_vegetation_a": ("ncar_ncl/NEO_div_vegetation_a.rgb", False),
+        "NEO_div_vegetation_a_r": ("ncar_ncl/NEO_div_vegetation_a.rgb", True),
+        "NEO_div_vegetation_b": ("ncar_ncl/NEO_div_vegetation_b.rgb", False),
+        "NEO_div_vegetation_b_r": ("ncar_ncl/NEO_div_vegetation_b.rgb", True),
+        "NEO_div_vegetation_c": ("ncar_ncl/NEO_div_vegetation_c.rgb", False),
+        "NEO_div_vegetation_c_r": ("ncar_ncl/NEO_div_vegetation_c.rgb", True),
+        "NEO_modis_ndvi": ("ncar_ncl/NEO_modis_ndvi.rgb", False),
+        "NEO_modis_ndvi_r": ("ncar_ncl/NEO_modis_ndvi.rgb", True),
+        "NMCRef": ("self_defined/NMCRef.rgb", False),
+        "NMCRef_r": ("self_defined/NMCRef.rgb", True),
+        "NMCVel": ("ncar_ncl/NMCVel.rgb", False),
+        "NMCVel_r": ("ncar_ncl/NMCVel.rgb", True),
+        "NOC_ndvi": ("ncar_ncl/NOC_ndvi.rgb", False),
+        "NOC_ndvi_r": ("ncar_ncl/NOC_ndvi.rgb", True),
+        "OceanLakeLandSnow": ("ncar_ncl/OceanLakeLandSnow.rgb", False),
+        "OceanLakeLandSnow_r": ("ncar_ncl/OceanLakeLandSnow.rgb", True),
+        "SVG_Gallet13": ("ncar_ncl/SVG_Gallet13.rgb", False),
+        "SVG_Gallet13_r": ("ncar_ncl/SVG_Gallet13.rgb", True),
+        "SVG_Lindaa06": ("ncar_ncl/SVG_Lindaa06.rgb", False),
+        "SVG_Lindaa06_r": ("ncar_ncl/SVG_Lindaa06.rgb", True),
+        "SVG_Lindaa07": ("ncar_ncl/SVG_Lindaa07.rgb", False),
+        "SVG_Lindaa07_r": ("ncar_ncl/SVG_Lindaa07.rgb", True),
+        "SVG_bhw3_22": ("ncar_ncl/SVG_bhw3_22.rgb", False),
+        "SVG_bhw3_22_r": ("ncar_ncl/SVG_bhw3_22.rgb", True),
+        "SVG_es_landscape_79": ("ncar_ncl/SVG_es_landscape_79.rgb", False),
+        "SVG_es_landscape_79_r": ("ncar_ncl/SVG_es_landscape_79.rgb", True),
+        "SVG_feb_sunrise": ("ncar_ncl/SVG_feb_sunrise.rgb", False),
+        "SVG_feb_sunrise_r": ("ncar_ncl/SVG_feb_sunrise.rgb", True),
+        "SVG_foggy_sunrise": ("ncar_ncl/SVG_foggy_sunrise.rgb", False),
+        "SVG_foggy_sunrise_r": ("ncar_ncl/SVG_foggy_sunrise.rgb", True),
+        "SVG_fs2006": ("ncar_ncl/SVG_fs2006.rgb", False),
+        "SVG_fs2006_r": ("ncar_ncl/SVG_fs2006.rgb", True),
+        "StepSeq25": ("ncar_ncl/StepSeq25.rgb", False),
+        "StepSeq25_r": ("ncar_ncl/StepSeq25.rgb", True),
+        "UKM_hadcrut": ("ncar_ncl/UKM_hadcrut.rgb", False),
+        "UKM_hadcrut_r": ("ncar_ncl/UKM_hadcrut.rgb", True),
+        "ViBlGrWhYeOrRe": ("ncar_ncl/ViBlGrWhYeOrRe.rgb", False),
+        "ViBlGrWhYeOrRe_r": ("ncar_ncl/ViBlGrWhYeOrRe.rgb", True),
+        "WhBlGrYeRe": ("ncar_ncl/WhBlGrYeRe.rgb", False),
+        "WhBlGrYeRe_r": ("ncar_ncl/WhBlGrYeRe.rgb", True),
+        "WhBlReWh": ("ncar_ncl/WhBlReWh.rgb", False),
+        "WhBlReWh_r": ("ncar_ncl/WhBlReWh.rgb", True),
+        "WhViBlGrYeOrRe": ("ncar_ncl/WhViBlGrYeOrRe.rgb", False),
+        "WhViBlGrYeOrRe_r": ("ncar_ncl/WhViBlGrYeOrRe.rgb", True),
+        "WhViBlGrYeOrReWh": ("ncar_ncl/WhViBlGrYeOrReWh.rgb", False),
+        "WhViBlGrYeOrReWh_r": ("ncar_ncl/WhViBlGrYeOrReWh.rgb", True),
+        "WhiteBlue": ("ncar_ncl/WhiteBlue.rgb", False),
+        "WhiteBlue_r": ("ncar_ncl/WhiteBlue.rgb", True),
+        "WhiteBlueGreenYellowRed": ("ncar_ncl/WhiteBlueGreenYellowRed.rgb", False),
+        "WhiteBlueGreenYellowRed_r": ("ncar_ncl/WhiteBlueGreenYellowRed.rgb", True),
+        "WhiteGreen": ("ncar_ncl/WhiteGreen.rgb", False),
+        "WhiteGreen_r": ("ncar_ncl/WhiteGreen.rgb", True),
+        "WhiteYellowOrangeRed": ("ncar_ncl/WhiteYellowOrangeRed.rgb", False),
+        "WhiteYellowOrangeRed_r": ("ncar_ncl/WhiteYellowOrangeRed.rgb", True),
+        "amwg": ("ncar_ncl/amwg.rgb", False),
+        "amwg_r": ("ncar_ncl/amwg.rgb", True),
+        "amwg256": ("ncar_ncl/amwg256.rgb", False),
+        "amwg256_r": ("ncar_ncl/amwg256.rgb", True),
+        "amwg_blueyellowred": ("ncar_ncl/amwg_blueyellowred.rgb", False),
+        "amwg_blueyellowred_r": ("ncar_ncl/amwg_blueyellowred.rgb", True),
+        "cb_9step": ("ncar_ncl/cb_9step.rgb", False),
+        "cb_9step_r": ("ncar_ncl/cb_9step.rgb", True),
+        "cb_rainbow": ("ncar_ncl/cb_rainbow.rgb", False),
+        "cb_rainbow_r": ("ncar_ncl/cb_rainbow.rgb", True),
+        "cb_rainbow_inv": ("ncar_ncl/cb_rainbow_inv.rgb", False),
+        "cb_rainbow_inv_r": ("ncar_ncl/cb_rainbow_inv.rgb", True),
+        "circular_0": ("ncar_ncl/circular_0.rgb", False),
+        "circular_0_r": ("ncar_ncl/circular_0.rgb", True),
+        "circular_1": ("ncar_ncl/circular_1.rgb", False),
+        "circular_1_r": ("ncar_ncl/circular_1.rgb", True),
+        "circular_2": ("ncar_ncl/circular_2.rgb", False),
+        "circular_2_r": ("ncar_ncl/circular_2.rgb", True),
+        "cividis": ("ncar_ncl/cividis.rgb", False),
+        "cividis_r": ("ncar_ncl/cividis.rgb", True),
+        "cmocean_algae": ("ncar_ncl/cmocean_algae.rgb", False),
+        "cmocean_algae_r": ("ncar_ncl/cmocean_algae.rgb", True),
+        "cmocean_amp": ("ncar_ncl/cmocean_amp.rgb", False),
+        "cmocean_amp_r": ("ncar_ncl/cmocean_amp.rgb", True),
+        "cmocean_balance": ("ncar_ncl/cmocean_balance.rgb", False),
+        "cmocean_balance_r": ("ncar_ncl/cmocean_balance.rgb", True),
+        "cmocean_curl": ("ncar_ncl/cmocean_curl.rgb", False),
+        "cmocean_curl_r": ("ncar_ncl/cmocean_curl.rgb", True),
+        "cmocean_deep": ("ncar_ncl/cmocean_deep.rgb", False),
+        "cmocean_deep_r": ("ncar_ncl/cmocean_deep.rgb", True),
+        "cmocean_delta": ("ncar_ncl/cmocean_delta.rgb", False),
+        "cmocean_delta_r": ("ncar_ncl/cmocean_delta.rgb", True),
+        "cmocean_dense": ("ncar_ncl/cmocean_dense.rgb", False),
+        "cmocean_dense_r": ("ncar_ncl/cmocean_dense.rgb", True),
+        "cmocean_gray": ("ncar_ncl/cmocean_gray.rgb", False),
+        "cmocean_gray_r": ("ncar_ncl/cmocean_gray.rgb", True),
+        "cmocean_haline": ("ncar_ncl/cmocean_haline.rgb", False),
+        "cmocean_haline_r": ("ncar_ncl/cmocean_haline.rgb", True),
+        "cmocean_ice": ("ncar_ncl/cmocean_ice.rgb", False),
+        "cmocean_ice_r": ("ncar_ncl/cmocean_ice.rgb", True),
+        "cmocean_matter": ("ncar_ncl/cmocean_matter.rgb", False),
+        "cmocean_matter_r": ("ncar_ncl/cmocean_matter.rgb", True),
+        "cmocean_oxy": ("ncar_ncl/cmocean_oxy.rgb", False),
+        "cmocean_oxy_r": ("ncar_ncl/cmocean_oxy.rgb", True),
+        "cmocean_phase": ("ncar_ncl/cmocean_phase.rgb", False),
+        "cmocean_phase_r": ("ncar_ncl/cmocean_phase.rgb", True),
+        "cmocean_solar": ("ncar_ncl/cmocean_solar.rgb", False),
+        "cmocean_solar_r": ("ncar_ncl/cmocean_solar.rgb", True),
+        "cmocean_speed": ("ncar_ncl/cmocean_speed.rgb", False),
+        "cmocean_speed_r": ("ncar_ncl/cmocean_speed.rgb", True),
+        "cmocean_tempo": ("ncar_ncl/cmocean_tempo.rgb", False),
+        "cmocean_tempo_r": ("ncar_ncl/cmocean_tempo.rgb", True),
+        "cmocean_thermal": ("ncar_ncl/cmocean_thermal.rgb", False),
+        "cmocean_thermal_r": ("ncar_ncl/cmocean_thermal.rgb", True),
+        "cmocean_turbid": ("ncar_ncl/cmocean_turbid.rgb", False),
+        "cmocean_turbid_r": ("ncar_ncl/cmocean_turbid.rgb", True),
+        "cmp_b2r": ("ncar_ncl/cmp_b2r.rgb", False),
+        "cmp_b2r_r": ("ncar_ncl/cmp_b2r.rgb", True),
+        "cmp_flux": ("ncar_ncl/cmp_flux.rgb", False),
+        "cmp_flux_r": ("ncar_ncl/cmp_flux.rgb", True),
+        "cmp_haxby": ("ncar_ncl/cmp_haxby.rgb", False),
+        "cmp_haxby_r": ("ncar_ncl/cmp_haxby.rgb", True),
+        "cosam": ("ncar_ncl/cosam.rgb", False),
+        "cosam_r": ("ncar_ncl/cosam.rgb", True),
+        "cosam12": ("ncar_ncl/cosam12.rgb", False),
+        "cosam12_r": ("ncar_ncl/cosam12.rgb", True),
+        "cyclic": ("ncar_ncl/cyclic.rgb", False),
+        "cyclic_r": ("ncar_ncl/cyclic.rgb", True),
+        "default": ("ncar_ncl/default.rgb", False),
+        "default_r": ("ncar_ncl/default.rgb", True),
+        "detail": ("ncar_ncl/detail.rgb", False),
+        "detail_r": ("ncar_ncl/detail.rgb", True),
+        "drought_severity": ("ncar_ncl/drought_severity.rgb", False),
+        "drought_severity_r": ("ncar_ncl/drought_severity.rgb", True),
+        "example": ("ncar_ncl/example.rgb", False),
+        "example_r": ("ncar_ncl/example.rgb", True),
+        "extrema": ("ncar_ncl/extrema.rgb", False),
+        "extrema_r": ("ncar_ncl/extrema.rgb", True),
+        "grads_default": ("ncar_ncl/grads_default.rgb", False),
+        "grads_default_r": ("ncar_ncl/grads_default.rgb", True),
+        "grads_rainbow": ("ncar_ncl/grads_rainbow.rgb", False),
+        "grads_rainbow_r": ("ncar_ncl/grads_rainbow.rgb", True),
+        "gscyclic": ("ncar_ncl/gscyclic.rgb", False),
+        "gscyclic_r": ("ncar_ncl/gscyclic.rgb", True),
+        "gsdtol": ("ncar_ncl/gsdtol.rgb", False),
+        "gsdtol_r": ("ncar_ncl/gsdtol.rgb", True),
+        "gsltod": ("ncar_ncl/gsltod.rgb", False),
+        "gsltod_r": ("ncar_ncl/gsltod.rgb", True),
+        "gui_default": ("ncar_ncl/gui_default.rgb", False),
+        "gui_default_r": ("ncar_ncl/gui_default.rgb", True),
+        "helix": ("ncar_ncl/helix.rgb", False),
+        "helix_r": ("ncar_ncl/helix.rgb", True),
+        "helix1": ("ncar_ncl/helix1.rgb", False),
+        "helix1_r": ("ncar_ncl/helix1.rgb", True),
+        "hlu_default": ("ncar_ncl/hlu_default.rgb", False),
+        "hlu_default_r": ("ncar_ncl/hlu_default.rgb", True),
+        "hotcold_18lev": ("ncar_ncl/hotcold_18lev.rgb", False),
+        "hotcold_18lev_r": ("ncar_ncl/hotcold_18lev.rgb", True),
+        "hotcolr_19lev": ("ncar_ncl/hotcolr_19lev.rgb", False),
+        "hotcolr_19lev_r": ("ncar_ncl/hotcolr_19lev.rgb", True),
+        "hotres": ("ncar_ncl/hotres.rgb", False),
+        "hotres_r": ("ncar_ncl/hotres.rgb", True),
+        "lithology": ("ncar_ncl/lithology.rgb", False),
+        "lithology_r": ("ncar_ncl/lithology.rgb", True),
+        "matlab_hot": ("ncar_ncl/matlab_hot.rgb", False),
+        "matlab_hot_r": ("ncar_ncl/matlab_hot.rgb", True),
+        "matlab_hsv": ("ncar_ncl/matlab_hsv.rgb", False),
+        "matlab_hsv_r": ("ncar_ncl/matlab_hsv.rgb", True),
+        "matlab_jet": ("ncar_ncl/matlab_jet.rgb", False),
+        "matlab_jet_r": ("ncar_ncl/matlab_jet.rgb", True),
+        "matlab_lines": ("ncar_ncl/matlab_lines.rgb", False),
+        "matlab_lines_r": ("ncar_ncl/matlab_lines.rgb", True),
+        "mch_default": ("ncar_ncl/mch_default.rgb", False),
+        "mch_default_r": ("ncar_ncl/mch_default.rgb", True),
+        "ncl_default": ("ncar_ncl/ncl_default.rgb", False),
+        "ncl_default_r": ("ncar_ncl/ncl_default.rgb", True),
+        "ncview_default": ("ncar_ncl/ncview_default.rgb", False),
+        "ncview_default_r": ("ncar_ncl/ncview_default.rgb", True),
+        "nice_gfdl": ("ncar_ncl/nice_gfdl.rgb", False),
+        "nice_gfdl_r": ("ncar_ncl/nice_gfdl.rgb", True),
+        "nrl_sirkes": ("ncar_ncl/nrl_sirkes.rgb", False),
+        "nrl_sirkes_r": ("ncar_ncl/nrl_sirkes.rgb", True),
+        "nrl_sirkes_nowhite": ("ncar_ncl/nrl_sirkes_nowhite.rgb", False),
+        "nrl_sirkes_nowhite_r": ("ncar_ncl/nrl_sirkes_nowhite.rgb", True),
+        "perc2_9lev": ("ncar_ncl/perc2_9lev.rgb", False),
+        "perc2_9lev_r": ("ncar_ncl/perc2_9lev.rgb", True),
+        "percent_11lev": ("ncar_ncl/percent_11lev.rgb", False),
+        "percent_11lev_r": ("ncar_ncl/percent_11lev.rgb", True),
+        "posneg_1": ("ncar_ncl/posneg_1.rgb", False),
+        "posneg_1_r": ("ncar_ncl/posneg_1.rgb", True),
+        "posneg_2": ("ncar_ncl/posneg_2.rgb", False),
+        "posneg_2_r": ("ncar_ncl/posneg_2.rgb", True),
+        "prcp_1": ("ncar_ncl/prcp_1.rgb", False),
+        "prcp_1_r": ("ncar_ncl/prcp_1.rgb", True),
+        "prcp_2": ("ncar_ncl/prcp_2.rgb", False),
+        "prcp_2_r": ("ncar_ncl/prcp_2.rgb", True),
+        "prcp_3": ("ncar_ncl/prcp_3.rgb", False),
+        "prcp_3_r": ("ncar_ncl/prcp_3.rgb", True),
+        "precip2_15lev": ("ncar_ncl/precip2_15lev.rgb", False),
+        "precip2_15lev_r": ("ncar_ncl/precip2_15lev.rgb", True),
+        "precip2_17lev": ("ncar_ncl/precip2_17lev.rgb", False),
+        "precip2_17lev_r": ("ncar_ncl/precip2_17lev.rgb", True),
+        "precip3_16lev": ("ncar_ncl/precip3_16lev.rgb", False),
+        "precip3_16lev_r": ("ncar_ncl/precip3_16lev.rgb", True),
+        "precip4_11lev": ("ncar_ncl/precip4_11lev.rgb", False),
+        "precip4_11lev_r": ("ncar_ncl/precip4_11lev.rgb", True),
+        "precip4_diff_19lev": ("ncar_ncl/precip4_diff_19lev.rgb", False),
+        "precip4_diff_19lev_r": ("ncar_ncl/precip4_diff_19lev.rgb", True),
+        "precip_11lev": ("ncar_ncl/precip_11lev.rgb", False),
+        "precip_11lev_r": ("ncar_ncl/precip_11lev.rgb", True),
+        "precip_diff_12lev": ("ncar_ncl/precip_diff_12lev.rgb", False),
+        "precip_diff_12lev_r": ("ncar_ncl/precip_diff_12lev.rgb", True),
+        "precip_diff_1lev": ("ncar_ncl/precip_diff_1lev.rgb", False),
+        "precip_diff_1lev_r": ("ncar_ncl/precip_diff_1lev.rgb", True),
+        "psgcap": ("ncar_ncl/psgcap.rgb", False),
+        "psgcap_r": ("ncar_ncl/psgcap.rgb", True),
+        "radar": ("ncar_ncl/radar.rgb", False),
+        "radar_r": ("ncar_ncl/radar.rgb", True),
+        "radar_1": ("ncar_ncl/radar_1.rgb", False),
+        "radar_1_r": ("ncar_ncl/radar_1.rgb", True),
+        "cmaps_rainbow_gray": ("ncar_ncl/rainbow+gray.rgb", False),
+        "cmaps_rainbow_gray_r": ("ncar_ncl/rainbow+gray.rgb", True),
+        "cmaps_rainbow_white_gray": ("ncar_ncl/rainbow+white+gray.rgb", False),
+        "cmaps_rainbow_white_gray_r": ("ncar_ncl/rainbow+white+gray.rgb", True),
+        "cmaps_rainbow_white": ("ncar_ncl/rainbow+white.rgb", False),
+        "cmaps_rainbow_white_r": ("ncar_ncl/rainbow+white.rgb", True),
+        "rainbow": ("ncar_ncl/rainbow.rgb", False),
+        "rainbow_r": ("ncar_ncl/rainbow.rgb", True),
+        "rh_19lev": ("ncar_ncl/rh_19lev.rgb", False),
+        "rh_19lev_r": ("ncar_ncl/rh_19lev.rgb", True),
+        "seaice_1": ("ncar_ncl/seaice_1.rgb", False),
+        "seaice_1_r": ("ncar_ncl/seaice_1.rgb", True),
+        "seaice_2": ("ncar_ncl/seaice_2.rgb", False),
+        "seaice_2_r": ("ncar_ncl/seaice_2.rgb", True),
+        "so4_21": ("ncar_ncl/so4_21.rgb", False),
+        "so4_21_r": ("ncar_ncl/so4_21.rgb", True),
+        "so4_23": ("ncar_ncl/so4_23.rgb", False),
+        "so4_23_r": ("ncar_ncl/so4_23.rgb", True),
+        "spread_15lev": ("ncar_ncl/spread_15lev.rgb", False),
+        "spread_15lev_r": ("ncar_ncl/spread_15lev.rgb", True),
+        "srip_reanalysis": ("ncar_ncl/srip_reanalysis.rgb", False),
+        "srip_reanalysis_r": ("ncar_ncl/srip_reanalysis.rgb", True),
+        "sunshine_9lev": ("ncar_ncl/sunshine_9lev.rgb", False),
+        "sunshine_9lev_r": ("ncar_ncl/sunshine_9lev.rgb", True),
+        "sunshine_diff_12lev": ("ncar_ncl/sunshine_diff_12lev.rgb", False),
+        "sunshine_diff_12lev_r": ("ncar_ncl/sunshine_diff_12lev.rgb", True),
+        "t2m_29lev": ("ncar_ncl/t2m_29lev.rgb", False),
+        "t2m_29lev_r": ("ncar_ncl/t2m_29lev.rgb", True),
+        "tbrAvg1": ("ncar_ncl/tbrAvg1.rgb", False),
+        "tbrAvg1_r": ("ncar_ncl/tbrAvg1.rgb", True),
+        "tbrStd1": ("ncar_ncl/tbrStd1.rgb", False),
+        "tbrStd1_r": ("ncar_ncl/tbrStd1.rgb", True),
+        "tbrVar1": ("ncar_ncl/tbrVar1.rgb", False),
+        "tbrVar1_r": ("ncar_ncl/tbrVar1.rgb", True),
+        "cmaps_tbr_240_300": ("ncar_ncl/tbr_240-300.rgb", False),
+        "cmaps_tbr_240_300_r": ("ncar_ncl/tbr_240-300.rgb", True),
+        "cmaps_tbr_stdev_0_30": ("ncar_ncl/tbr_stdev_0-30.rgb", False),
+        "cmaps_tbr_stdev_0_30_r": ("ncar_ncl/tbr_stdev_0-30.rgb", True),
+        "cmaps_tbr_var_0_500": ("ncar_ncl/tbr_var_0-500.rgb", False),
+        "cmaps_tbr_var_0_500_r": ("ncar_ncl/tbr_var_0-500.rgb", True),
+        "temp1": ("ncar_ncl/temp1.rgb", False),
+        "temp1_r": ("ncar_ncl/temp1.rgb", True),
+        "temp_19lev": ("ncar_ncl/temp_19lev.rgb", False),
+        "temp_19lev_r": ("ncar_ncl/temp_19lev.rgb", True),
+        "temp_diff_18lev": ("ncar_ncl/temp_diff_18lev.rgb", False),
+        "temp_diff_18lev_r": ("ncar_ncl/temp_diff_18lev.rgb", True),
+        "temp_diff_1lev": ("ncar_ncl/temp_diff_1lev.rgb", False),
+        "temp_diff_1lev_r": ("ncar_ncl/temp_diff_1lev.rgb", True),
+        "testcmap": ("ncar_ncl/testcmap.rgb", False),
+        "testcmap_r": ("ncar_ncl/testcmap.rgb", True),
+        "thelix": ("ncar_ncl/thelix.rgb", False),
+        "thelix_r": ("ncar_ncl/thelix.rgb", True),
+        "topo_15lev": ("ncar_ncl/topo_15lev.rgb", False),
+        "topo_15lev_r": ("ncar_ncl/topo_15lev.rgb", True),
+        "uniform": ("ncar_ncl/uniform.rgb", False),
+        "uniform_r": ("ncar_ncl/uniform.rgb", True),
+        "vegetation_ClarkU": ("ncar_ncl/vegetation_ClarkU.rgb", False),
+        "vegetation_ClarkU_r": ("ncar_ncl/vegetation_ClarkU.rgb", True),
+        "vegetation_modis": ("ncar_ncl/vegetation_modis.rgb", False),
+        "vegetation_modis_r": ("ncar_ncl/vegetation_modis.rgb", True),
+        "wgne15": ("ncar_ncl/wgne15.rgb", False),
+        "wgne15_r": ("ncar_ncl/wgne15.rgb", True),
+        "cmaps_wh_bl_gr_ye_re": ("ncar_ncl/wh-bl-gr-ye-re.rgb", False),
+        "cmaps_wh_bl_gr_ye_re_r": ("ncar_ncl/wh-bl-gr-ye-re.rgb", True),
+        "wind_17lev": ("ncar_ncl/wind_17lev.rgb", False),
+        "wind_17lev_r": ("ncar_ncl/wind_17lev.rgb", True),
+        "wxpEnIR": ("ncar_ncl/wxpEnIR.rgb", False),
+        "wxpEnIR_r": ("ncar_ncl/wxpEnIR.rgb", True),
+        "Carbone42": ("self_defined/Carbone42.rgb", False),
+        "Carbone42_r": ("self_defined/Carbone42.rgb", True),
+        "EO_aura_omi_formal": ("self_defined/EO_aura_omi_formal.rgb", False),
+        "EO_aura_omi_formal_r": ("self_defined/EO_aura_omi_formal.rgb", True),
+        "EO_carbon_density": ("self_defined/EO_carbon_density.rgb", False),
+        "EO_carbon_density_r": ("self_defined/EO_carbon_density.rgb", True),
+        "EO_lightning_lis_otd": ("self_defined/EO_lightning_lis_otd.rgb", False),
+        "EO_lightning_lis_otd_r": ("self_defined/EO_lightning_lis_otd.rgb", True),
+        "EO_sargassum_tamo": ("self_defined/EO_sargassum_tamo.rgb", False),
+        "EO_sargassum_tamo_r": ("self_defined/EO_sargassum_tamo.rgb", True),
+        "EO_soil_moist_div": ("self_defined/EO_soil_moist_div.rgb", False),
+        "EO_soil_moist_div_r": ("self_defined/EO_soil_moist_div.rgb", True),
+        "EO_temp_anom_4": ("self_defined/EO_temp_anom_4.rgb", False),
+        "EO_temp_anom_4_r": ("self_defined/EO_temp_anom_4.rgb", True),
+        "EVL_wind_anom": ("self_defined/EVL_wind_anom.rgb", False),
+        "EVL_wind_anom_r": ("self_defined/EVL_wind_anom.rgb", True),
+        "GISS_isccp_rainbow": ("self_defined/GISS_isccp_rainbow.rgb", False),
+        "GISS_isccp_rainbow_r": ("self_defined/GISS_isccp_rainbow.rgb", True),
+        "GISS_isccp_rainbow_20": ("self_defined/GISS_isccp_rainbow_20.rgb", False),
+        "GISS_isccp_rainbow_20_r": ("self_defined/GISS_isccp_rainbow_20.rgb", True),
+        "GMT_earth": ("self_defined/GMT_earth.rgb", False),
+        "GMT_earth_r": ("self_defined/GMT_earth.rgb", True),
+        "GMT_seis_20": ("self_defined/GMT_seis_20.rgb", False),
+        "GMT_seis_20_r": ("self_defined/GMT_seis_20.rgb", True),
+        "MRO_ice_freq": ("self_defined/MRO_ice_freq.rgb", False),
+        "MRO_ice_freq_r": ("self_defined/MRO_ice_freq.rgb", True),
+        "NCDC_snow_anom": ("self_defined/NCDC_snow_anom.rgb", False),
+        "NCDC_snow_anom_r": ("self_defined/NCDC_snow_anom.rgb", True),
+        "NCDC_temp_anom_f": ("self_defined/NCDC_temp_anom_f.rgb", False),
+        "NCDC_temp_anom_f_r": ("self_defined/NCDC_temp_anom_f.rgb", True),
+        "NEO_albedo_change": ("self_defined/NEO_albedo_change.rgb", False),
+        "NEO_albedo_change_r": ("self_defined/NEO_albedo_change.rgb", True),
+        "NEO_amsre_ss": ("self_defined/NEO_amsre_ss.rgb", False),
+        "NEO_amsre_ss_r": ("self_defined/NEO_amsre_ss.rgb", True),
+        "NEO_amsre_sst_anom": ("self_defined/NEO_amsre_sst_anom.rgb", False),
+        "NEO_amsre_sst_anom_r": ("self_defined/NEO_amsre_sst_anom.rgb", True),
+        "NEO_aod_diff": ("self_defined/NEO_aod_diff.rgb", False),
+        "NEO_aod_diff_r": ("self_defined/NEO_aod_diff.rgb", True),
+        "NEO_aquarius_sss": ("self_defined/NEO_aquarius_sss.rgb", False),
+        "NEO_aquarius_sss_r": ("self_defined/NEO_aquarius_sss.rgb", True),
+        "NEO_bright_temp": ("self_defined/NEO_bright_temp.rgb", False),
+        "NEO_bright_temp_r": ("self_defined/NEO_bright_temp.rgb", True),
+        "NEO_carb_emit_anom": ("self_defined/NEO_carb_emit_anom.rgb", False),
+        "NEO_carb_emit_anom_r": ("self_defined/NEO_carb_emit_anom.rgb", True),
+        "NEO_cdom": ("self_defined/NEO_cdom.rgb", False),
+        "NEO_cdom_r": ("self_defined/NEO_cdom.rgb", True),
+        "NEO_ceres_insol": ("self_defined/NEO_ceres_insol.rgb", False),
+        "NEO_ceres_insol_r": ("self_defined/NEO_ceres_insol.rgb", True),
+        "NEO_ceres_lw": ("self_defined/NEO_ceres_lw.rgb", False),
+        "NEO_ceres_lw_r": ("self_defined/NEO_ceres_lw.rgb", True),
+        "NEO_ceres_ne": ("self_defined/NEO_ceres_ne.rgb", False),
+        "NEO_ceres_ne_r": ("self_defined/NEO_ceres_ne.rgb", True),
+        "NEO_ceres_sw": ("self_defined/NEO_ceres_sw.rgb", False),
+        "NEO_ceres_sw_r": ("self_defined/NEO_ceres_sw.rgb", True),
+        "NEO_chlorophyll": ("self_defined/NEO_chlorophyll.rgb", False),
+        "NEO_chlorophyll_r": ("self_defined/NEO_chlorophyll.rgb", True),
+        "NEO_chlorophyll_o": ("self_defined/NEO_chlorophyll_o.rgb", False),
+        "NEO_chlorophyll_o_r": ("self_defined/NEO_chlorophyll_o.rgb", True),
+        "NEO_div_vegetation_": ("self_defined/NEO_div_vegetation_.rgb", False),
+        "NEO_div_vegetation__r": ("self_defined/NEO_div_vegetation_.rgb", True),
+        "NEO_evapstress": ("self_defined/NEO_evapstress.rgb", False),
+        "NEO_evapstress_r": ("self_defined/NEO_evapstress.rgb", True),
+        "NEO_gebco_bathymetry": ("self_defined/NEO_gebco_bathymetry.rgb", False),
+        "NEO_gebco_bathymetry_r": ("self_defined/NEO_gebco_bathymetry.rgb", True),
+        "NEO_ggmcf": ("self_defined/NEO_ggmcf.rgb", False),
+        "NEO_ggmcf_r": ("self_defined/NEO_ggmcf.rgb", True),
+        "NEO_giss_temp_anom": ("self_defined/NEO_giss_temp_anom.rgb", False),
+        "NEO_giss_temp_anom_r": ("self_defined/NEO_giss_temp_anom.rgb", True),
+        "NEO_grace_lwe_anom": ("self_defined/NEO_grace_lwe_anom.rgb", False),
+        "NEO_grace_lwe_anom_r": ("self_defined/NEO_grace_lwe_anom.rgb", True),
+        "NEO_grav_anom": ("self_defined/NEO_grav_anom.rgb", False),
+        "NEO_grav_anom_r": ("self_defined/NEO_grav_anom.rgb", True),
+        "NEO_imperv_surf": ("self_defined/NEO_imperv_surf.rgb", False),
+        "NEO_imperv_surf_r": ("self_defined/NEO_imperv_surf.rgb", True),
+        "NEO_meltseason_anom": ("self_defined/NEO_meltseason_anom.rgb", False),
+        "NEO_meltseason_anom_r": ("self_defined/NEO_meltseason_anom.rgb", True),
+        "NEO_modis_aer_od": ("self_defined/NEO_modis_aer_od.rgb", False),
+        "NEO_modis_aer_od_r": ("self_defined/NEO_modis_aer_od.rgb", True),
+        "NEO_modis_bs_albedo": ("self_defined/NEO_modis_bs_albedo.rgb", False),
+        "NEO_modis_bs_albedo_r": ("self_defined/NEO_modis_bs_albedo.rgb", True),
+        "NEO_modis_chlor": ("self_defined/NEO_modis_chlor.rgb", False),
+        "NEO_modis_chlor_r": ("self_defined/NEO_modis_chlor.rgb", True),
+        "NEO_modis_cld_ci": ("self_defined/NEO_modis_cld_ci.rgb", False),
+        "NEO_modis_cld_ci_r": ("self_defined/NEO_modis_cld_ci.rgb", True),
+        "NEO_modis_cld_fr": ("self_defined/NEO_modis_cld_fr.rgb", False),
+        "NEO_modis_cld_fr_r": ("self_defined/NEO_modis_cld_fr.rgb", True),
+        "NEO_modis_cld_o": ("self_defined/NEO_modis_cld_o.rgb", False),
+        "NEO_modis_cld_o_r": ("self_defined/NEO_modis_cld_o.rgb", True),
+        "NEO_modis_cld_rd": ("self_defined/NEO_modis_cld_rd.rgb", False),
+        "NEO_modis_cld_rd_r": ("self_defined/NEO_modis_cld_rd.rgb", True),
+        "NEO_modis_cld_wp": ("self_defined/NEO_modis_cld_wp.rgb", False),
+        "NEO_modis_cld_wp_r": ("self_defined/NEO_modis_cld_wp.rgb", True),
+        "NEO_modis_ls": ("self_defined/NEO_modis_ls.rgb", False),
+        "NEO_modis_ls_r": ("self_defined/NEO_modis_ls.rgb", True),
+        "NEO_modis_lst_anom": ("self_defined/NEO_modis_lst_anom.rgb", False),
+        "NEO_modis_lst_anom_r": ("self_defined/NEO_modis_lst_anom.rgb", True),
+        "NEO_modis_sky_wv": ("self_defined/NEO_modis_sky_wv.rgb", False),
+        "NEO_modis_sky_wv_r": ("self_defined/NEO_modis_sky_wv.rgb", True),
+        "NEO_modis_sst_45": ("self_defined/NEO_modis_sst_45.rgb", False),
+        "NEO_modis_sst_45_r": ("self_defined/NEO_modis_sst_45.rgb", True),
+        "NEO_mopitt_co": ("self_defined/NEO_mopitt_co.rgb", False),
+        "NEO_mopitt_co_r": ("self_defined/NEO_mopitt_co.rgb", True),
+        "NEO_ns_airtemp": ("self_defined/NEO_ns_airtemp.rgb", False),
+        "NEO_ns_airtemp_r": ("self_defined/NEO_ns_airtemp.rgb", True),
+        "NEO_omi_no2": ("self_defined/NEO_omi_no2.rgb", False),
+        "NEO_omi_no2_r": ("self_defined/NEO_omi_no2.rgb", True),
+        "NEO_omi_ozone_to3": ("self_defined/NEO_omi_ozone_to3.rgb", False),
+        "NEO_omi_ozone_to3_r": ("self_defined/NEO_omi_ozone_to3.rgb", True),
+        "NEO_omi_uvi": ("self_defined/NEO_omi_uvi.rgb", False),
+        "NEO_omi_uvi_r": ("self_defined/NEO_omi_uvi.rgb", True),
+        "NEO_pollution_conc_9": ("self_defined/NEO_pollution_conc_9.rgb", False),
+        "NEO_pollution_conc_9_r": ("self_defined/NEO_pollution_conc_9.rgb", True),
+        "NEO_pollution_mor": ("self_defined/NEO_pollution_mor.rgb", False),
+        "NEO_pollution_mor_r": ("self_defined/NEO_pollution_mor.rgb", True),
+        "NEO_rainfall_anom_9": ("self_defined/NEO_rainfall_anom_9.rgb", False),
+        "NEO_rainfall_anom_9_r": ("self_defined/NEO_rainfall_anom_9.rgb", True),
+        "NEO_seasurf_hgt_anom": ("self_defined/NEO_seasurf_hgt_anom.rgb", False),
+        "NEO_seasurf_hgt_anom_r": ("self_defined/NEO_seasurf_hgt_anom.rgb", True),
+        "NEO_sedac_pop": ("self_defined/NEO_sedac_pop.rgb", False),
+        "NEO_sedac_pop_r": ("self_defined/NEO_sedac_pop.rgb", True),
+        "NEO_snow_water": ("self_defined/NEO_snow_water.rgb", False),
+        "NEO_snow_water_r": ("self_defined/NEO_snow_water.rgb", True),
+        "NEO_soil_moisture": ("self_defined/NEO_soil_moisture.rgb", False),
+        "NEO_soil_moisture_r": ("self_defined/NEO_soil_moisture.rgb", True),
+        "NEO_soil_moisture_anom": ("self_defined/NEO_soil_moisture_anom.rgb", False),
+        "NEO_soil_moisture_anom_r": ("self_defined/NEO_soil_moisture_anom.rgb", True),
+        "NEO_soil_moisture_anom_nl": ("self_defined/NEO_soil_moisture_anom_nl.rgb", False),
+        "NEO_soil_moisture_anom_nl_r": ("self_defined/NEO_soil_moisture_anom_nl.rgb", True),
+        "NEO_soil_moisture_pale": ("self_defined/NEO_soil_moisture_pale.rgb", False),
+        "NEO_soil_moisture_pale_r": ("self_defined/NEO_soil_moisture_pale.rgb", True),
+        "NEO_srtm_topography": ("self_defined/NEO_srtm_topography.rgb", False),
+        "NEO_srtm_topography_r": ("self_defined/NEO_srtm_topography.rgb", True),
+        "NEO_tree_cover": ("self_defined/NEO_tree_cover.rgb", False),
+        "NEO_tree_cover_r": ("self_defined/NEO_tree_cover.rgb", True),
+        "NEO_trmm_rainfall": ("self_defined/NEO_trmm_rainfall.rgb", False),
+        "NEO_trmm_rainfall_r": ("self_defined/NEO_trmm_rainfall.rgb", True),
+        "NEO_wind_spd_anom": ("self_defined/NEO_wind_spd_anom.rgb", False),
+        "NEO_wind_spd_anom_r": ("self_defined/NEO_wind_spd_anom.rgb", True),
+        "NEO_wind_spd_anomaly_pwg": ("self_defined/NEO_wind_spd_anomaly_pwg.rgb", False),
+        "NEO_wind_spd_anomaly_pwg_r": ("self_defined/NEO_wind_spd_anomaly_pwg.rgb", True),
+        "NMCVel2": ("self_defined/NMCVel2.rgb", False),
+        "NMCVel2_r": ("self_defined/NMCVel2.rgb", True),
+        "NWSRef": ("self_defined/NWSRef.rgb", False),
+        "NWSRef_r": ("self_defined/NWSRef.rgb", True),
+        "NWSSPW": ("self_defined/NWSSPW.rgb", False),
+        "NWSSPW_r": ("self_defined/NWSSPW.rgb", True),
+        "NWSVel": ("self_defined/NWSVel.rgb", False),
+        "NWSVel_r": ("self_defined/NWSVel.rgb", True),
+        "NYT_drought": ("self_defined/NYT_drought.rgb", False),
+        "NYT_drought_r": ("self_defined/NYT_drought.rgb", True),
+        "SVS_soilmoisture": ("self_defined/SVS_soilmoisture.rgb", False),
+        "SVS_soilmoisture_r": ("self_defined/SVS_soilmoisture.rgb", True),
+        "SVS_tempanomaly": ("self_defined/SVS_tempanomaly.rgb", False),
+        "SVS_tempanomaly_r": ("self_defined/SVS_tempanomaly.rgb", True),
+        "TopoGray": ("self_defined/TopoGray.rgb", False),
+        "TopoGray_r": ("self_defined/TopoGray.rgb", True),
+        "TwoClass": ("self_defined/TwoClass.rgb", False),
+        "TwoClass_r": ("self_defined/TwoClass.rgb", True),
+        "UKM_hadcrut_10": ("self_defined/UKM_hadcrut_10.rgb", False),
+        "UKM_hadcrut_10_r": ("self_defined/UKM_hadcrut_10.rgb", True),
+        "mask": ("self_defined/mask.rgb", False),
+        "mask_r": ("self_defined/mask.rgb", True),
+    }
@@ -1,44 +1,511 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+import hashlib
+import struct
+import threading
+import zlib
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from matplotlib import colors
 
-class Colormap(colors.ListedColormap):
+# number of values mapped per pass by Colormap.apply, bounds its temporaries
+_APPLY_BLOCK = 1 << 20
+
+# linear sRGB <-> CIE XYZ (D65) and the D65 white point
+_RGB2XYZ = np.array([[0.4124564, 0.3575761, 0.1804375],
+                     [0.2126729, 0.7151522, 0.0721750],
+                     [0.0193339, 0.1191920, 0.9503041]])
+_XYZ2RGB = np.linalg.inv(_RGB2XYZ)
+_WHITE = np.array([0.95047, 1., 1.08883])
+# linear sRGB <-> LMS and cube-rooted LMS <-> OKLab (Ottosson 2020)
+_RGB2LMS = np.array([[0.4122214708, 0.5363325363, 0.0514459929],
+                     [0.2119034982, 0.6806995451, 0.1073969566],
+                     [0.0883024619, 0.2817188376, 0.6299787005]])
+_LMS2RGB = np.linalg.inv(_RGB2LMS)
+_LMS2OKLAB = np.array([[0.2104542553, 0.7936177850, -0.0040720468],
+                       [1.9779984951, -2.4285922050, 0.4505937099],
+                       [0.0259040371, 0.7827717662, -0.8086757660]])
+_OKLAB2LMS = np.linalg.inv(_LMS2OKLAB)
+
+
+def _to_linear(rgb):
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def _from_linear(rgb):
+    rgb = np.clip(rgb, 0., 1.)
+    return np.where(rgb <= 0.0031308, rgb * 12.92, 1.055 * rgb ** (1 / 2.4) - 0.055)
+
+
+def _to_space(rgb, space):
+    '''convert an Nx3 sRGB table to space, in one vectorized pass'''
+    if space == 'srgb':
+        return rgb
+    lin = _to_linear(rgb)
+    if space == 'linear':
+        return lin
+    elif space == 'cielab':
+        xyz = lin @ _RGB2XYZ.T / _WHITE
+        f = np.where(xyz > (6 / 29) ** 3, np.cbrt(xyz), xyz / (3 * (6 / 29) ** 2) + 4 / 29)
+        return np.stack([116 * f[:, 1] - 16, 500 * (f[:, 0] - f[:, 1]), 200 * (f[:, 1] - f[:, 2])], axis=1)
+    elif space == 'oklab':
+        return np.cbrt(lin @ _RGB2LMS.T) @ _LMS2OKLAB.T
+    raise ValueError("space must be 'srgb', 'linear', 'cielab' or 'oklab', not {!r}".format(space))
+
+
+def _from_space(values, space):
+    '''inverse of _to_space, out of gamut colors are clipped'''
+    if space == 'srgb':
+        return np.clip(values, 0., 1.)
+    elif space == 'linear':
+        lin = values
+    elif space == 'cielab':
+        fy = (values[:, 0] + 16) / 116
+        f = np.stack([fy + values[:, 1] / 500, fy, fy - values[:, 2] / 200], axis=1)
+        xyz = np.where(f > 6 / 29, f ** 3, 3 * (6 / 29) ** 2 * (f - 4 / 29)) * _WHITE
+        lin = xyz @ _XYZ2RGB.T
+    elif space == 'oklab':
+        lin = (values @ _OKLAB2LMS.T) ** 3 @ _LMS2RGB.T
+    return _from_linear(lin)
+
+
+def _resample(table, lutsize):
+    '''
+    linearly resample the colors (axis -2) of table to lutsize colors, all channels
+    at once: each new color sits between two old ones
+    '''
+    n = table.shape[-2]
+    pos = np.linspace(0., n - 1, lutsize)
+    lo = np.minimum(pos.astype(int), max(n - 2, 0))
+    hi = np.minimum(lo + 1, n - 1)
+    w = (pos - lo)[:, np.newaxis]
+    return table[..., lo, :] * (1 - w) + table[..., hi, :] * w
+
+
+class _Concatenation(object):
+    '''tables of a colormap built by concat or +, stacked only when first needed'''
+    def __init__(self, parts):
+        self.parts = parts
+
+    def __len__(self):
+        return sum(len(part) for part in self.parts)
+
+    def stack(self):
+        '''one table, RGB parts get an opaque alpha if any part has one'''
+        parts = [np.asarray(part, float) for part in self.parts]
+        if len({part.shape[1] for part in parts}) > 1:
+            parts = [np.hstack([part, np.ones((len(part), 1))]) if part.shape[1] == 3 else part for part in parts]
+        return np.vstack(parts)
+
+
+# colormaps derived by interp and to_seg, least recently used first
+_resampled = OrderedDict()
+_resampled_lock = threading.Lock()
+_resampled_stats = {'hits': 0, 'misses': 0, 'maxsize': 128}
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+def cache_info():
+    '''statistics of the interp/to_seg cache, as functools.lru_cache reports them'''
+    with _resampled_lock:
+        return CacheInfo(_resampled_stats['hits'], _resampled_stats['misses'],
+                         _resampled_stats['maxsize'], len(_resampled))
+
+
+def set_cache_size(maxsize):
+    '''keep at most maxsize derived colormaps (None for no limit, 0 disables the cache)'''
+    if maxsize is not None and maxsize < 0:
+        raise ValueError('maxsize must be None or >= 0, not {}'.format(maxsize))
+    with _resampled_lock:
+        _resampled_stats['maxsize'] = maxsize
+        _evict()
+
+
+def clear_cache():
+    '''drop the cached colormaps and reset the statistics'''
+    with _resampled_lock:
+        _resampled.clear()
+        _resampled_stats.update(hits=0, misses=0)
+
+
+def _evict():
+    maxsize = _resampled_stats['maxsize']
+    while maxsize is not None and len(_resampled) > maxsize:
+        _resampled.popitem(last=False)
+
+
+def _cached(key, build):
+    '''
+    the colormap cached under key, built (outside the lock) and frozen on a miss,
+    so repeated derivations return the same object
+    '''
+    with _resampled_lock:
+        if key in _resampled:
+            _resampled_stats['hits'] += 1
+            _resampled.move_to_end(key)
+            return _resampled[key]
+        _resampled_stats['misses'] += 1
+    cmap = build()
+    cmap._frozen = True
+    with _resampled_lock:
+        # another thread may have built it meanwhile, keep the first one
+        cmap = _resampled.setdefault(key, cmap)
+        _evict()
+    return cmap
+
+
+class _Freezable(object):
+    '''
+    cached colormaps are shared, so their extremes can not be set in place;
+    copy() and with_extremes() return modifiable copies
+    '''
+    def _check_frozen(self):
+        # the public setters only: the private hooks fill the LUT in _init on some versions
+        if self.__dict__.get('_frozen'):
+            raise ValueError('{} is cached and shared, set the extremes of a copy '
+                             '(cmap.with_extremes(...) or cmap.copy())'.format(self.name))
+
+    def set_bad(self, *args, **kwargs):
+        self._check_frozen()
+        return super(_Freezable, self).set_bad(*args, **kwargs)
+
+    def set_under(self, *args, **kwargs):
+        self._check_frozen()
+        return super(_Freezable, self).set_under(*args, **kwargs)
+
+    def set_over(self, *args, **kwargs):
+        self._check_frozen()
+        return super(_Freezable, self).set_over(*args, **kwargs)
+
+    def set_extremes(self, *args, **kwargs):
+        self._check_frozen()
+        return super(_Freezable, self).set_extremes(*args, **kwargs)
+
+    def __copy__(self):
+        cmapobject = super(_Freezable, self).__copy__()
+        cmapobject._frozen = False
+        return cmapobject
+
+
+class _SegmentedColormap(_Freezable, colors.LinearSegmentedColormap):
+    pass
+
+
+class Colormap(_Freezable, colors.ListedColormap):
     def __init__(self, c, name='from_list', n=None):
         '''Initialization'''
         self._colors = c
         self._name = name
         if n is None:
             self._N = len(c)
+            # without N, ListedColormap keeps c as is instead of copying it into a list
+            super(Colormap, self).__init__(c, name=self._name)
         else:
             self._N = n
+            super(Colormap, self).__init__(c, name=self._name, N=self._N)
 
-        # call parent __init__
-        super(Colormap, self).__init__(self._colors, name=self._name, N=self._N)
+    @property
+    def colors(self):
+        table = self.__dict__.get('_table')
+        if isinstance(table, _Concatenation):
+            table = self._table = table.stack()
+        return table
+
+    @colors.setter
+    def colors(self, c):
+        self._table = c
+        # everything derived from the previous table is stale
+        for attr in ('_table_sha1', '_spaces', '_view_of'):
+            self.__dict__.pop(attr, None)
+        self._isinit = False
+
+    # set by __init__, ListedColormap sets colors: both are the same table
+    _colors = colors
 
     def __getitem__(self, item):
-        return Colormap(self._colors[item], name='sliced_' + self._name)
-    
+        '''
+        slices of an array table are views sharing its colors, their LUT is taken
+        from the LUT of this colormap when first needed
+        '''
+        cmap = Colormap(self._colors[item], name='sliced_' + self._name)
+        if isinstance(item, slice) and isinstance(self._colors, np.ndarray) and self.N == len(self._colors):
+            cmap._view_of = self, item
+        return cmap
+
+    def reversed(self, name=None):
+        '''reversed view of the colormap, under and over colors swapped as in matplotlib'''
+        cmap = self[::-1]
+        cmap.name = cmap._name = self.name + '_r' if name is None else name
+        cmap._rgba_under, cmap._rgba_over, cmap._rgba_bad = self._rgba_over, self._rgba_under, self._rgba_bad
+        return cmap
+
+    def _init(self):
+        view_of = self.__dict__.pop('_view_of', None)
+        if view_of is None:
+            return super(Colormap, self)._init()
+        parent, item = view_of
+        if not parent._isinit:
+            parent._init()
+        # a local LUT first, in case of parallel threads as in ListedColormap._init
+        lut = np.empty((self.N + 3, 4))
+        lut[:-3] = parent._lut[:parent.N][item]
+        self._lut = lut
+        self._isinit = True
+        # matplotlib < 3.11 names it _set_extremes
+        (getattr(self, '_update_lut_extremes', None) or self._set_extremes)()
+
         # adding two objects
     def __add__(self, o):
-        return Colormap(np.vstack([self.colors, o.colors]), self.name+'_' +o.name)
-    
-    def interp(self, lutsize:int):
+        '''a + b + c is stacked once, when the sum is first used'''
+        return Colormap.concat([self, o])
+
+    @staticmethod
+    def concat(cmaps, weights=None, n=None, name=None):
+        '''
+        join cmaps end to end, their tables are stacked once when the result is
+        first used. With weights, each cmap is resampled to take that share of
+        the n colors (by default as many as all of theirs), e.g. weights=[1, 2]
+        for a diverging map whose upper half spans twice the range of the lower
+        '''
+        parts = []
+        for cmap in cmaps:
+            table = cmap.__dict__.get('_table')
+            # sums still pending are flattened, so no intermediate is stacked
+            parts.append(table.parts if isinstance(table, _Concatenation) else [cmap.colors])
+        if name is None:
+            name = '_'.join(cmap.name for cmap in cmaps)
+        if weights is None and n is None:
+            return Colormap(_Concatenation([table for tables in parts for table in tables]), name=name)
+
+        tables = [_Concatenation(tables).stack() for tables in parts]
+        if weights is None:
+            weights = [len(table) for table in tables]
+        if len(weights) != len(tables):
+            raise ValueError('weights must have one value per colormap')
+        if n is None:
+            n = sum(len(table) for table in tables)
+        # largest remainders, so the sizes add up to n
+        shares = np.asarray(weights, float) / np.sum(weights) * n
+        sizes = np.floor(shares).astype(int)
+        sizes[np.argsort(sizes - shares)[:n - sizes.sum()]] += 1
+        return Colormap(_Concatenation([table if len(table) == size else _resample(table, size)
+                                        for table, size in zip(tables, sizes) if size]), name=name)
+
+
+    def _float_table(self):
+        '''the colors as a float array, color names (e.g. 'red') are converted to RGBA'''
+        try:
+            return np.asarray(self._colors, dtype=float)
+        except ValueError:
+            return colors.to_rgba_array(self._colors)
+
+    def _table_hash(self):
+        '''sha1 of the color table, identifies the derived colormaps in the cache'''
+        if '_table_sha1' not in self.__dict__:
+            table = np.ascontiguousarray(self._float_table())
+            self._table_sha1 = hashlib.sha1(table.tobytes() + str(table.shape).encode()).hexdigest()
+        return self._table_sha1
+
+    def interp(self, lutsize:int, space='srgb'):
         '''
         different from resampled of the new version of matplotlib (we interp colors here)
+
+        colors are interpolated in space: 'srgb' (as stored), 'linear' (linear-light
+        RGB), 'cielab' or 'oklab' (perceptual), alpha (if any) linearly. The result
+        is cached (see cache_info) and shared, so its extremes can not be set in place
         '''
-        r, g, b = self._colors[:, 0], self._colors[:, 1], self._colors[:, 2]
-        x_n = np.linspace(0., 1., lutsize)
-        x_o = np.linspace(0., 1., self._N)
-        
-        colors_new = np.hstack([np.interp(x_n, x_o, _).reshape(-1, 1) for _ in [r, g, b]]) 
+        return _cached((self._table_hash(), 'interp', lutsize, space, self._name),
+                       lambda: self._interp(lutsize, space))
+
+    def _interp(self, lutsize, space):
+        table = self._float_table()
+        # the table is converted once per space
+        converted = self.__dict__.setdefault('_spaces', {}).get(space)
+        if converted is None:
+            converted = self._spaces[space] = np.hstack([_to_space(table[:, :3], space), table[:, 3:]])
+        values = _resample(converted, lutsize)
+        colors_new = np.hstack([_from_space(values[:, :3], space), values[:, 3:]])
+        colors_new.setflags(write=False)
         return Colormap(colors_new, name='interp_' + self._name)
-    
 
     def to_seg(self, N=None):
+        '''
+        LinearSegmentedColormap through the colors, cached and shared like interp
+        '''
         if N is None:
             N = len(self._colors)
-        return colors.LinearSegmentedColormap.from_list('seg_' +self._name, self._colors, N=N)
+        return _cached((self._table_hash(), 'to_seg', N, self._name), lambda: self._to_seg(N))
+
+    def _to_seg(self, N):
+        cmap = colors.LinearSegmentedColormap.from_list('seg_' + self._name, self._colors, N=N)
+        # same object, with the guard against setting the extremes of a cached colormap
+        cmap.__class__ = _SegmentedColormap
+        return cmap
+
+    def _apply_lut(self, dtype):
+        '''
+        LUT ordered as [under, colors..., over, bad] in dtype (uint8 is scaled like
+        __call__ with bytes=True), rebuilt only when the extremes change
+        '''
+        if not self._isinit:
+            self._init()
+        state = (id(self._lut), self._rgba_under, self._rgba_over, self._rgba_bad)
+        if getattr(self, '_apply_lut_state', None) != state:
+            self._apply_lut_state, self._apply_luts = state, {}
+        dtype = np.dtype(dtype)
+        if dtype not in self._apply_luts:
+            N = self.N
+            lut = self._lut[np.r_[N, 0:N, N + 1, N + 2]]
+            if dtype == np.uint8:
+                lut = (lut * 255).astype(dtype)
+            elif dtype.kind == 'f':
+                lut = lut.astype(dtype)
+            else:
+                raise ValueError('dtype must be uint8 or a float type, not {}'.format(dtype))
+            self._apply_luts[dtype] = lut
+        return self._apply_luts[dtype]
+
+    def apply(self, data, vmin=None, vmax=None, out=None, dtype='uint8', workers=None):
+        '''
+        map data to RGBA through a LUT precomputed once per colormap, a faster and
+        lighter alternative to __call__ (with a Normalize) for large arrays
+
+        data is scaled linearly from [vmin, vmax] (its range by default) into the N
+        colors, values below and above get the under and over colors, NaN and
+        masked values the bad color. The result has shape data.shape + (4,), it is
+        written into out if given, which must be C-contiguous and of dtype.
+        With workers > 1 the data is split into bands mapped by that many threads
+        '''
+        mask = np.ma.getmaskarray(data) if np.ma.isMaskedArray(data) else None
+        data = np.asarray(np.ma.getdata(data))
+        if (vmin is None or vmax is None) and data.size:
+            valid = data if mask is None else data[~mask]
+            if not valid.size:
+                # everything is masked and gets the bad color, any range will do
+                valid = np.zeros(1)
+            with np.errstate(invalid='ignore'):
+                vmin = np.nanmin(valid) if vmin is None else vmin
+                vmax = np.nanmax(valid) if vmax is None else vmax
+        if vmin is not None and vmax is not None and vmin > vmax:
+            raise ValueError('vmin must be less than or equal to vmax')
+
+        lut = self._apply_lut(dtype)
+        if out is None:
+            out = np.empty(data.shape + (4,), lut.dtype)
+        elif out.shape != data.shape + (4,) or out.dtype != lut.dtype or not out.flags.c_contiguous:
+            raise ValueError('out must be a C-contiguous {} array of shape {}'.format(lut.dtype, data.shape + (4,)))
+
+        if not data.size:
+            return out
+
+        ftype = np.float32 if data.dtype in (np.float16, np.float32) else np.float64
+        scale = self.N / (vmax - vmin) if vmax > vmin else 0.
+        data = data.reshape(-1)
+        mask = None if mask is None else mask.reshape(-1)
+        rgba = out.reshape(-1, 4)
+        if workers is None or workers <= 1 or data.size <= _APPLY_BLOCK:
+            self._apply_band(data, mask, vmin, scale, ftype, lut, rgba)
+        else:
+            # numpy releases the GIL in the ufuncs and take, so bands map in parallel
+            bounds = np.linspace(0, data.size, workers + 1).astype(int)
+            with ThreadPoolExecutor(workers) as pool:
+                bands = [pool.submit(self._apply_band, data[a:b], None if mask is None else mask[a:b],
+                                     vmin, scale, ftype, lut, rgba[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+                for band in bands:
+                    band.result()
+        return out
+
+    def _apply_band(self, data, mask, vmin, scale, ftype, lut, rgba):
+        '''map flat data into rgba in blocks of _APPLY_BLOCK values, see apply'''
+        N = self.N
+        xa = np.empty(min(data.size, _APPLY_BLOCK), ftype)
+        idx = np.empty(xa.size, np.intp)
+        for start in range(0, data.size, _APPLY_BLOCK):
+            stop = min(start + _APPLY_BLOCK, data.size)
+            x, i = xa[:stop - start], idx[:stop - start]
+            np.subtract(data[start:stop], vmin, out=x, casting='unsafe')
+            x *= scale
+            # vmax maps to the last color as in __call__, then shift so 0 is under
+            x[x == N] = N - 1
+            x += 1
+            np.clip(x, 0, N + 1, out=x)
+            np.copyto(x, N + 2, where=np.isnan(x))
+            if mask is not None:
+                x[mask[start:stop]] = N + 2
+            np.copyto(i, x, casting='unsafe')
+            np.take(lut, i, axis=0, out=rgba[start:stop], mode='clip')
+
+    def apply_chunks(self, blocks, norm, dtype='uint8', workers=None):
+        '''
+        colorize an iterable of blocks (row blocks of a memmap, tiles read from
+        HDF5/NetCDF, ...) with apply, yielding one RGBA block per input block
+
+        norm is a (vmin, vmax) pair or a matplotlib Normalize with vmin and vmax
+        set, the range cannot be taken from the data as it is never seen at once.
+        One output buffer is reused while the block shape does not change, so
+        copy a yielded block if it has to outlive the next iteration. workers is
+        passed on to apply
+        '''
+        if isinstance(norm, colors.Normalize):
+            if not norm.scaled():
+                raise ValueError('norm must have vmin and vmax set')
+            # other norms (log, boundary, clipping, ...) are applied block by block,
+            # integer results (BoundaryNorm) index the colors directly
+            linear = type(norm) is colors.Normalize and not norm.clip
+            vmin, vmax = (norm.vmin, norm.vmax) if linear else (0., 1.)
+        else:
+            (vmin, vmax), linear = norm, True
+
+        out = None
+        for block in blocks:
+            block = np.asanyarray(block) if linear else norm(block)
+            if out is None or out.shape != block.shape + (4,):
+                out = np.empty(block.shape + (4,), self._apply_lut(dtype).dtype)
+            if not linear and block.dtype.kind in 'iu':
+                # BoundaryNorm (or NoNorm on integers) gives color indices, as in __call__
+                yield self._apply_indices(block, out, dtype)
+            else:
+                yield self.apply(block, vmin, vmax, out=out, dtype=dtype, workers=workers)
+
+    def _apply_indices(self, idx, out, dtype):
+        '''map color indices into out, -1 and below is under, N and above over'''
+        lut = self._apply_lut(dtype)
+        mask = np.ma.getmaskarray(idx) if np.ma.isMaskedArray(idx) else None
+        pos = np.clip(np.ma.getdata(idx), -1, self.N).astype(np.intp) + 1
+        if mask is not None:
+            pos[mask] = self.N + 2
+        return lut.take(pos, axis=0, out=out)
+
+    def with_levels(self, bounds, extend='neither'):
+        '''
+        the colormap paired with a BoundaryNorm for contour-style levels, see Levels.
+        The colors are spread over the bins as BoundaryNorm does, extend is
+        'neither', 'min', 'max' or 'both'
+        '''
+        if np.any(np.diff(bounds) <= 0):
+            raise ValueError('bounds must be increasing')
+        return Levels(self, colors.BoundaryNorm(bounds, self.N, extend=extend))
+
+    def to_image(self, width=256, height=32, format='png'):
+        '''
+        encode a horizontal gradient strip of the colormap as png (RGBA) or ppm (RGB)
+        bytes, straight from the uint8 LUT without any figure
+        '''
+        row = self.apply(np.linspace(0., 1., width), 0., 1.)
+        if format == 'ppm':
+            return b'P6\n%d %d\n255\n' % (width, height) + row[:, :3].tobytes() * height
+        elif format == 'png':
+            # every scanline starts with filter type 0 (none)
+            idat = zlib.compress((b'\x00' + row.tobytes()) * height)
+            ihdr = struct.pack('>IIBBBBB', width, height, 8, 6, 0, 0, 0)
+            return b'\x89PNG\r\n\x1a\n' + b''.join(
+                struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+                for tag, data in [(b'IHDR', ihdr), (b'IDAT', idat), (b'IEND', b'')])
+        else:
+            raise ValueError("format must be 'png' or 'ppm', not {!r}".format(format))
 
     def show(self):
         import matplotlib.pyplot as plt
@@ -52,3 +519,72 @@ class Colormap(colors.ListedColormap):
                  verticalalignment='center', horizontalalignment='center',
                  fontsize=12, transform=plt.gca().transAxes)
         plt.show()
+
+
+class Levels(object):
+    '''
+    a colormap and the BoundaryNorm of its levels, from Colormap.with_levels
+
+    pass cmap and norm on to matplotlib (cmap, norm = levels also works), or call
+    it on data to classify it straight to RGBA: the color of every bin is looked up
+    once, so mapping is a searchsorted over the bounds and a palette take
+    '''
+    def __init__(self, cmap, norm):
+        self.cmap = cmap
+        self.norm = norm
+        self.bounds = np.asarray(norm.boundaries, float)
+        self._palettes = {}
+
+    def __iter__(self):
+        return iter((self.cmap, self.norm))
+
+    def palette(self, dtype='uint8'):
+        '''
+        colors of [under, bins..., over, bad] as the norm and cmap map them, where
+        values equal to the last bound are over as in BoundaryNorm. Rebuilt when
+        the colors or extremes of the cmap change, as Colormap._apply_lut
+        '''
+        cmap = self.cmap
+        if not cmap._isinit:
+            cmap._init()
+        state = (id(cmap._lut), cmap._rgba_under, cmap._rgba_over, cmap._rgba_bad)
+        if getattr(self, '_palettes_state', None) != state:
+            self._palettes_state, self._palettes = state, {}
+        dtype = np.dtype(dtype)
+        if dtype not in self._palettes:
+            if not (dtype == np.uint8 or dtype.kind == 'f'):
+                raise ValueError('dtype must be uint8 or a float type, not {}'.format(dtype))
+            # one value per bin of searchsorted(bounds, x, 'right'), then a masked one
+            values = np.r_[self.bounds[0] - 1, self.bounds]
+            palette = self.cmap(np.ma.masked_array(np.r_[self.norm(values), 0], np.r_[values * 0, 1]),
+                                bytes=dtype == np.uint8)
+            self._palettes[dtype] = palette.astype(dtype, copy=False)
+        return self._palettes[dtype]
+
+    def __call__(self, data, out=None, dtype='uint8'):
+        '''
+        RGBA of data (shape data.shape + (4,)), NaN and masked values get the bad
+        color. out, if given, must be a C-contiguous array of that shape and dtype
+        '''
+        palette = self.palette(dtype)
+        mask = np.ma.getmaskarray(data) if np.ma.isMaskedArray(data) else None
+        data = np.asarray(np.ma.getdata(data))
+        if out is None:
+            out = np.empty(data.shape + (4,), palette.dtype)
+        elif out.shape != data.shape + (4,) or out.dtype != palette.dtype or not out.flags.c_contiguous:
+            raise ValueError('out must be a C-contiguous {} array of shape {}'.format(palette.dtype,
+                                                                                      data.shape + (4,)))
+        data = data.reshape(-1)
+        mask = None if mask is None else mask.reshape(-1)
+        rgba = out.reshape(-1, 4)
+        bad = len(palette) - 1
+        # in blocks of _APPLY_BLOCK values, as Colormap.apply
+        for start in range(0, data.size, _APPLY_BLOCK):
+            stop = min(start + _APPLY_BLOCK, data.size)
+            idx = np.searchsorted(self.bounds, data[start:stop], side='right')
+            if data.dtype.kind == 'f':
+                idx[np.isnan(data[start:stop])] = bad
+            if mask is not None:
+                idx[mask[start:stop]] = bad
+            palette.take(idx, axis=0, out=rgba[start:stop])
+        return out
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+render the colormap gallery (the swatches shown in the README and the
+colormaps.png contact sheet) with a pool of processes:
+
+    python -m cmaps.gallery --jobs 8 --outdir examples
+
+with --incremental only the colormaps whose table changed since the last run
+are rendered again, and the contact sheet and --readme table are only rewritten
+when something changed
+'''
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import cmaps
+from cmaps.colormap import Colormap
+
+# the gradient drawn for every colormap
+GRADIENT = np.outer(np.arange(0, 1, 0.001), np.ones(10)).T
+
+# figure and image of the current worker, reused for all of its swatches
+_swatch = None
+
+# checksums of the rendered swatches, kept in the output directory
+STATE_FILE = '.gallery.json'
+
+
+def _render_swatch(name, outdir, fmt, size, dpi):
+    global _swatch
+    start = time.perf_counter()
+    filename = os.path.join(outdir, '{}.{}'.format(name, fmt))
+    if fmt in ('png', 'ppm'):
+        # drawn straight from the LUT, no figure needed
+        cmap = Colormap(cmaps.table(name), name=name)
+        with open(filename, 'wb') as f:
+            f.write(cmap.to_image(*size, format=fmt))
+        return name, time.perf_counter() - start
+
+    if _swatch is None:
+        from matplotlib.figure import Figure
+        fig = Figure(figsize=(10, 1))
+        ax = fig.add_subplot(111)
+        ax.axis('off')
+        _swatch = fig, ax.imshow(GRADIENT, aspect='auto', origin='lower')
+    fig, im = _swatch
+    im.set_cmap(getattr(cmaps, name))
+    fig.savefig(filename, dpi=dpi, format=fmt, bbox_inches='tight', pad_inches=0.01)
+    return name, time.perf_counter() - start
+
+
+def render_swatches(names, outdir='.', jobs=None, fmt='png', size=(1000, 100), dpi=500, log=sys.stderr):
+    '''
+    render one swatch per colormap with jobs processes (all CPUs by default, 1 renders
+    in this process). png and ppm swatches of size (width, height) are encoded
+    directly by Colormap.to_image, other formats are drawn by matplotlib at dpi
+    '''
+    start = time.perf_counter()
+    if not names:
+        return 0.
+    if jobs == 1:
+        done = (_render_swatch(name, outdir, fmt, size, dpi) for name in names)
+    else:
+        pool = ProcessPoolExecutor(jobs)
+        futures = [pool.submit(_render_swatch, name, outdir, fmt, size, dpi) for name in names]
+        done = (future.result() for future in as_completed(futures))
+    try:
+        for i, (name, seconds) in enumerate(done, 1):
+            print('[{:{w}d}/{}] {} {:.2f}s'.format(i, len(names), name, seconds, w=len(str(len(names)))), file=log)
+    finally:
+        if jobs != 1:
+            pool.shutdown()
+    elapsed = time.perf_counter() - start
+    print('{} swatches in {:.1f}s'.format(len(names), elapsed), file=log)
+    return elapsed
+
+
+def render_sheet(names, filename='colormaps.png', ncols=8, dpi=300):
+    '''all colormaps in one figure'''
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(40, 20))
+    fig.subplots_adjust(top=0.95, bottom=0.05, left=0.01, right=0.99)
+    for i, name in enumerate(names):
+        ax = fig.add_subplot(len(names) // ncols + 1, ncols * 2, 2 * (i + 1))
+        ax.axis('off')
+        ax.imshow(GRADIENT, aspect='auto', cmap=getattr(cmaps, name), origin='lower')
+        ax.text(0, 0, name, fontsize=10, ha='right', va='bottom')
+    fig.savefig(filename, dpi=dpi)
+
+
+def checksum(name):
+    '''sha1 of the table of a colormap, its swatch only changes when this does'''
+    return hashlib.sha1(np.ascontiguousarray(cmaps.table(name)).tobytes()).hexdigest()
+
+
+def write_readme_table(names, readme, outdir, fmt):
+    '''
+    rewrite the colormap table of the README to list names, returns whether the
+    file changed. The table runs from its header to the first line not starting with |
+    '''
+    with open(readme) as f:
+        lines = f.read().split('\n')
+    start = lines.index(next(l for l in lines if l.startswith('| names ')))
+    stop = next((i for i in range(start, len(lines)) if not lines[i].startswith('|')), len(lines))
+    prefix = os.path.relpath(outdir, os.path.dirname(os.path.abspath(readme))).replace(os.sep, '/')
+    # '_' sorts after letters, as the table always did
+    rows = ['| {:<27} | {:<72} '.format(name, '![{0}]({1}/{0}.{2})'.format(name, prefix, fmt))
+            for name in sorted(names, key=lambda _: _.lower().replace('_', '{'))]
+    new_lines = lines[:start + 2] + rows + lines[stop:]
+    if new_lines == lines:
+        return False
+    with open(readme, 'w') as f:
+        f.write('\n'.join(new_lines))
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m cmaps.gallery', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('names', nargs='*',
+                        help='colormaps whose swatch is rendered, all by default (the contact sheet and '
+                             'README table always list all colormaps)')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='number of processes, all CPUs by default')
+    parser.add_argument('-o', '--outdir', default='.', help='output directory')
+    parser.add_argument('--format', default='png',
+                        help='swatch image format, png and ppm are drawn without matplotlib figures')
+    parser.add_argument('--size', default='1000x100', help='WIDTHxHEIGHT of png and ppm swatches')
+    parser.add_argument('--dpi', type=int, default=500, help='resolution of swatches drawn by matplotlib')
+    parser.add_argument('--no-sheet', action='store_true', help='do not render the colormaps.png contact sheet')
+    parser.add_argument('--incremental', action='store_true',
+                        help='skip colormaps whose table did not change since the last run')
+    parser.add_argument('--readme', help='README whose colormap table is regenerated to link the swatches')
+    args = parser.parse_args(argv)
+
+    all_names = cmaps.list_cmaps()
+    names = args.names or all_names
+    os.makedirs(args.outdir, exist_ok=True)
+    size = tuple(int(_) for _ in args.size.split('x'))
+    sheet = os.path.join(args.outdir, 'colormaps.png')
+
+    state_file = os.path.join(args.outdir, STATE_FILE)
+    settings = [args.format, list(size), args.dpi]
+    checksums = {name: checksum(name) for name in names}
+    state = {'settings': settings, 'checksums': {}}
+    if args.incremental and os.path.isfile(state_file):
+        with open(state_file) as f:
+            old_state = json.load(f)
+        # swatches rendered with other settings are all stale
+        if old_state['settings'] == settings:
+            state = old_state
+    stale = [name for name in names if state['checksums'].get(name) != checksums[name] or
+             not os.path.isfile(os.path.join(args.outdir, '{}.{}'.format(name, args.format)))]
+    print('{} of {} swatches to render'.format(len(stale), len(names)), file=sys.stderr)
+
+    render_swatches(stale, args.outdir, args.jobs, args.format, size, args.dpi)
+    if not args.no_sheet and (stale or not args.incremental or not os.path.isfile(sheet) or
+                              set(all_names) != set(state.get('sheet', []))):
+        start = time.perf_counter()
+        render_sheet(all_names, sheet)
+        state['sheet'] = all_names
+        print('contact sheet in {:.1f}s'.format(time.perf_counter() - start), file=sys.stderr)
+    if args.readme and write_readme_table(all_names, args.readme, args.outdir, args.format):
+        print('updated the colormap table of {}'.format(args.readme), file=sys.stderr)
+
+    state['checksums'].update(checksums)
+    with open(state_file, 'w') as f:
+        json.dump(state, f)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+import timeit
+
+import numpy as np
+from matplotlib import colors
+import cmaps
+
+if __name__ == '__main__':
+    cmap = cmaps.BlAqGrYeOrReVi200
+    data = np.random.default_rng(0).normal(size=(4000, 4000)).astype('f4')
+    data[::97, ::89] = np.nan
+    norm = colors.Normalize(-2, 2)
+
+    stock = cmap(norm(data), bytes=True)
+    fast = cmap.apply(data, -2, 2)
+    out = np.empty_like(fast)
+    print('identical pixels: {:.4%}'.format(np.all(stock == fast, axis=-1).mean()))
+    assert np.array_equal(fast, cmap.apply(data, -2, 2, workers=4))
+
+    # norms returning color indices go straight to the LUT in apply_chunks
+    bounds = colors.BoundaryNorm(np.linspace(-2, 2, 11), cmap.N, extend='both')
+    chunked = np.vstack([block.copy() for block in cmap.apply_chunks(np.array_split(data, 8), bounds)])
+    assert np.array_equal(chunked, cmap(bounds(data), bytes=True)), 'apply_chunks differs with BoundaryNorm'
+    # integer blocks (e.g. a uint16 memmap) are scaled by a linear norm, not taken as indices
+    counts = np.arange(1000, dtype=np.uint16)
+    for norm in [(0, 1000), colors.Normalize(0, 1000)]:
+        chunked = np.concatenate([block.copy() for block in cmap.apply_chunks(np.array_split(counts, 3), norm)])
+        assert np.array_equal(chunked, cmap.apply(counts, 0, 1000)), 'apply_chunks differs on integer blocks'
+
+    for name, run in [('__call__', lambda: cmap(norm(data), bytes=True)),
+                      ('apply', lambda: cmap.apply(data, -2, 2)),
+                      ('apply(out=)', lambda: cmap.apply(data, -2, 2, out=out)),
+                      ('workers=4', lambda: cmap.apply(data, -2, 2, out=out, workers=4))]:
+        t = min(timeit.repeat(run, number=1, repeat=5))
+        print('{:12s} {}x{}: {:.0f} ms'.format(name, *data.shape, t * 1e3))
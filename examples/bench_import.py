@@ -0,0 +1,38 @@
+import argparse
+import os
+import subprocess
+import sys
+
+# run in a fresh interpreter: import cmaps, read a table and report what got imported
+CHILD = '''
+import sys, time
+start = time.perf_counter()
+import cmaps
+cmaps.table('amwg256')
+elapsed = time.perf_counter() - start
+heavy = [name for name in ('matplotlib', 'packaging') if name in sys.modules]
+print(elapsed, ','.join(heavy))
+'''
+
+
+def import_time():
+    '''(seconds to import cmaps and read one table, heavy modules imported meanwhile)'''
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.environ.get('PYTHONPATH', '')]))
+    out = subprocess.run([sys.executable, '-c', CHILD], env=env, check=True,
+                         stdout=subprocess.PIPE, universal_newlines=True).stdout.split()
+    return float(out[0]), out[1].split(',') if len(out) > 1 else []
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='import time of cmaps without matplotlib')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--max-ms', type=float, default=None, help='fail if the best run is slower')
+    args = parser.parse_args()
+
+    runs = [import_time() for _ in range(args.repeat)]
+    heavy = sorted(set(name for _, names in runs for name in names))
+    assert not heavy, 'importing cmaps and reading a table imported {}'.format(', '.join(heavy))
+    best = min(seconds for seconds, _ in runs) * 1e3
+    print('import cmaps + cmaps.table: {:.1f} ms (best of {})'.format(best, args.repeat))
+    assert args.max_ms is None or best <= args.max_ms, 'slower than {} ms'.format(args.max_ms)
@@ -0,0 +1,32 @@
+import os
+import re
+import timeit
+from glob import glob
+
+import numpy as np
+import cmaps
+
+CMAPSFILE_DIR = os.path.join(os.path.dirname(cmaps.__file__), 'colormaps')
+
+
+def regex_coltbl(cmap_file):
+    # the regex parser Cmaps._coltbl used to be
+    pattern = re.compile(r'(\d\.?\d*)\s+(\d\.?\d*)\s+(\d\.?\d*).*')
+    with open(cmap_file) as cmap:
+        cmap_buff = cmap.read()
+    cmap_buff = re.compile('ncolors.*\n').sub('', cmap_buff)
+    if re.search(r'\s*\d\.\d*', cmap_buff):
+        return np.asarray(pattern.findall(cmap_buff), 'f4')
+    else:
+        return np.asarray(pattern.findall(cmap_buff), 'u1') / 255.
+
+
+if __name__ == '__main__':
+    files = sorted(glob(os.path.join(CMAPSFILE_DIR, '*', '*.rgb')))
+    for cmap_file in files:
+        old, new = regex_coltbl(cmap_file), cmaps._coltbl(cmap_file)
+        assert old.dtype == new.dtype and np.array_equal(old, new), cmap_file
+
+    for name, parse in [('regex', regex_coltbl), ('loadtxt', cmaps._coltbl)]:
+        t = min(timeit.repeat(lambda: [parse(f) for f in files], number=1, repeat=5))
+        print('{:8s} {} files: {:.1f} ms'.format(name, len(files), t * 1e3))
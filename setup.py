@@ -1,10 +1,17 @@
+from array import array
 from glob import glob
 
 from setuptools import setup
+import hashlib
+import json
 import os
+import sys
+import warnings
 
 VERSION = '2.0.1'
 CMAPSFILE_DIR = os.path.join('./cmaps/colormaps')
+BUNDLE_FILE = os.path.join(CMAPSFILE_DIR, 'colormaps.bin')
+BUNDLE_MANIFEST = os.path.join(CMAPSFILE_DIR, 'colormaps.json')
 
 
 def write_version_py(version=VERSION, filename='cmaps/_version.py'):
@@ -21,65 +28,137 @@ def _listfname():
     l = {}
 
     l.update({'ncl': {
-        'p': 'os.path.join(CMAPSFILE_DIR, "ncar_ncl", ',
         'l': sorted(glob(os.path.join(CMAPSFILE_DIR, 'ncar_ncl/*.rgb')))}})
     l.update({'self_defined': {
-        'p': 'os.path.join(CMAPSFILE_DIR, "self_defined", ',
         'l': sorted(glob(os.path.join(CMAPSFILE_DIR, 'self_defined/*.rgb')))}})
 
     return l
 
 
+def _cname(cmap_file):
+    cname = os.path.basename(cmap_file).split('.rgb')[0]
+    # start with the number will result illegal attribute
+    if cname[0].isdigit() or cname.startswith('_'):
+        cname = 'N' + cname
+    if '-' in cname:
+        cname =  'cmaps_' + cname.replace('-', '_')
+    if '+' in cname:
+        cname =  'cmaps_' + cname.replace('+', '_')
+    return cname
+
+
 def write_cmaps(template_file='./cmaps.template'):
     with open(template_file, 'rt') as f:
         c = f.read()
+    # a later file with the same colormap name replaces the earlier one
+    index = {}
     l = _listfname()
     for t in l.keys():
         for cmap_file in l[t]['l']:
-            cname = os.path.basename(cmap_file).split('.rgb')[0]
-            # start with the number will result illegal attribute
-            if cname[0].isdigit() or cname.startswith('_'):
-                cname = 'N' + cname
-            if '-' in cname:
-                cname =  'cmaps_' + cname.replace('-', '_')
-            if '+' in cname:
-                cname =  'cmaps_' + cname.replace('+', '_')
-            c += '    @property\n'
-            c += '    def {}(self):\n'.format(cname)
-            c += '        cname = "{}"\n'.format(cname)
-            c += '        try:\n'
-            c += '            return get_cmap(cname)\n'
-            c += '        except:\n'
-            c += '            cmap_file = {} "{}")\n'.format(l[t]['p'], os.path.basename(cmap_file))
-            c += '            cmap = Colormap(self._coltbl(cmap_file), name=cname)\n'
-            c += '            register_cmap(name=cname, cmap=cmap)\n'
-            c += '            return cmap\n\n'
-
-            c += '    @property\n'
-            c += '    def {}(self):\n'.format(cname + '_r')
-            c += '        cname = "{}"\n'.format(cname + '_r')
-            c += '        try:\n'
-            c += '            return get_cmap(cname)\n'
-            c += '        except:\n'
-            c += '            cmap_file = {} "{}")\n'.format(l[t]['p'], os.path.basename(cmap_file))
-            c += '            cmap = Colormap(self._coltbl(cmap_file)[::-1], name=cname)\n'
-            c += '            register_cmap(name=cname, cmap=cmap)\n'
-            c += '            return cmap\n\n'
+            cname = _cname(cmap_file)
+            key = os.path.relpath(cmap_file, CMAPSFILE_DIR).replace(os.sep, '/')
+            index[cname] = (key, False)
+            index[cname + '_r'] = (key, True)
+
+    c += '    # colormap name -> (file relative to CMAPSFILE_DIR, reversed)\n'
+    c += '    _cmaps = {\n'
+    for cname, (key, reverse) in index.items():
+        c += '        "{}": ("{}", {}),\n'.format(cname, key, reverse)
+    c += '    }\n'
 
     cmapspy = './cmaps/cmaps.py'
     with open(cmapspy, 'wt') as fw:
         fw.write(c)
 
 
+def _coltbl(cmap_file):
+    '''
+    same parsing as Cmaps._coltbl, but without numpy at build time
+
+    returns the rows scaled to [0, 1] (RGB, or RGBA when every row has a numeric
+    fourth column), the dtype of the file ('u1' or 'f4') and the ncolors header
+    if there is one
+    '''
+    ncolors = None
+    rows = []
+    is_float = False
+    with open(cmap_file) as cmap:
+        for i, line in enumerate(cmap, 1):
+            if line.lstrip().startswith('ncolor'):
+                ncolors = int(line.partition('=')[2])
+                continue
+            line = line.partition('#')[0].partition(';')[0].partition('/*')[0]
+            values = line.split()
+            # lines not starting with a number are headers (e.g. 'r g b')
+            try:
+                float(values[0])
+            except (IndexError, ValueError):
+                continue
+            if len(values) < 3:
+                raise ValueError('{}:{}: expected 3 columns, got {!r}'.format(cmap_file, i, line.strip()))
+            # a fourth column is alpha if it is a number, a color name otherwise
+            try:
+                values = values[:3] + [float(values[3])]
+            except (IndexError, ValueError):
+                values = values[:3]
+            if rows and len(values) != len(rows[0]):
+                raise ValueError('{}:{}: alpha must be given for all colors or none'.format(cmap_file, i))
+            is_float = is_float or '.' in line
+            # NCL uses -1 as a placeholder, which is read as 1
+            rows.append([abs(float(v)) for v in values])
+    if not rows:
+        raise ValueError('{}: no colors found'.format(cmap_file))
+    if is_float:
+        return rows, 'f4', ncolors
+    if any(v != int(v) or v > 255 for row in rows for v in row):
+        raise ValueError('{}: integer colors must be in 0..255'.format(cmap_file))
+    return [[v / 255. for v in row] for row in rows], 'u1', ncolors
+
+
+def build_colormaps(bundle_file=BUNDLE_FILE, manifest_file=BUNDLE_MANIFEST):
+    '''
+    parse and validate every colormap once, then pack all tables into one
+    float32 file and describe them in a JSON manifest of
+    {file: {name, offset, N, channels, dtype, source, checksum}}, offset counting
+    values (tables are RGB or RGBA) and the checksum being the sha1 of the packed
+    table. cmaps trusts the manifest at runtime
+    '''
+    table = array('f')
+    manifest = {}
+    l = _listfname()
+    for t in l.keys():
+        for cmap_file in l[t]['l']:
+            rows, dtype, ncolors = _coltbl(cmap_file)
+            if any(not 0. <= v <= 1. for row in rows for v in row):
+                raise ValueError('{}: colors must be in [0, 1]'.format(cmap_file))
+            if ncolors is not None and ncolors != len(rows):
+                warnings.warn('{}: ncolors = {} but {} colors found'.format(cmap_file, ncolors, len(rows)))
+            packed = array('f', [v for row in rows for v in row])
+            if sys.byteorder == 'big':
+                packed.byteswap()
+            key = os.path.relpath(cmap_file, CMAPSFILE_DIR).replace(os.sep, '/')
+            manifest[key] = {'name': _cname(cmap_file), 'offset': len(table), 'N': len(rows),
+                             'channels': len(rows[0]), 'dtype': dtype, 'source': t,
+                             'checksum': hashlib.sha1(packed.tobytes()).hexdigest()}
+            table.extend(packed)
+    with open(bundle_file, 'wb') as fw:
+        table.tofile(fw)
+    with open(manifest_file, 'wt') as fw:
+        json.dump({'colormaps': manifest}, fw)
+
+
 write_version_py()
 write_cmaps()
+build_colormaps()
 setup(
     name='cmaps',
     author='Hao Huang',
     version=VERSION,
     author_email='hhuangwx@gmail.com',
     packages=['cmaps', ],
-    package_data={'cmaps': ['colormaps/ncar_ncl/*',
+    package_data={'cmaps': ['colormaps/colormaps.bin',
+                            'colormaps/colormaps.json',
+                            'colormaps/ncar_ncl/*',
                             'colormaps/self_defined/*'], },
     data_files=[('', ['cmaps.template', 'LICENSE']),],
     url='',